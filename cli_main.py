@@ -7,87 +7,104 @@ Optimized for Termux/Android environment
 import argparse
 import os
 import sys
-from csv_parser import CSVParser
-from duplicate_detector import DuplicateDetector
-from export_manager import ExportManager
+import time
+import logging
+
+__version__ = "1.0.0"
+
+logger = logging.getLogger(__name__)
 
 class DuplicateTicketCLI:
     """Command-line interface for duplicate ticket detection."""
     
+    # Minimum seconds between progress line redraws
+    PROGRESS_INTERVAL = 0.05
+    
     def __init__(self):
+        self._last_progress_time = 0.0
+        
+        # Heavy modules (pandas, fuzzy matching) are imported lazily so that
+        # argument errors and --help return without paying their import cost
+        from csv_parser import CSVParser
         self.csv_parser = CSVParser(repair_callback=self.repair_progress_callback)
         self.duplicate_detector = None
-        self.export_manager = ExportManager()
+        self.export_manager = None
     
     def run(self, args):
         """Main execution flow."""
-        print("ServiceNow Duplicate Ticket Detection Tool")
-        print("=" * 50)
+        logger.info("ServiceNow Duplicate Ticket Detection Tool")
+        logger.info("=" * 50)
         
         # Load and validate CSV (with optional repair)
-        print(f"Loading CSV file: {args.input}")
+        logger.info(f"Loading CSV file: {args.input}")
         success, message = self.csv_parser.load_and_validate(args.input, auto_repair=not args.no_auto_repair)
         
         if not success:
-            print(f"Error: {message}")
+            logger.error(f"Error: {message}")
             return 1
         
-        print(f"✓ {message}")
+        logger.info(f"✓ {message}")
         
         # Show data summary
         summary = self.csv_parser.get_data_summary()
-        print(f"  - Total tickets: {summary['total_tickets']}")
-        print(f"  - Unique sites: {summary['unique_sites']}")
-        print(f"  - Date range: {summary['date_range']['earliest'].strftime('%Y-%m-%d')} to {summary['date_range']['latest'].strftime('%Y-%m-%d')}")
+        logger.info(f"  - Total tickets: {summary['total_tickets']}")
+        logger.info(f"  - Unique sites: {summary['unique_sites']}")
+        logger.info(f"  - Date range: {summary['date_range']['earliest'].strftime('%Y-%m-%d')} to {summary['date_range']['latest'].strftime('%Y-%m-%d')}")
         if summary.get('resolved_tickets', 0) > 0:
-            print(f"  - Resolved tickets: {summary['resolved_tickets']}")
+            logger.info(f"  - Resolved tickets: {summary['resolved_tickets']}")
         if summary.get('was_repaired', False):
-            print("  ⚠️ File was auto-repaired due to corruption")
-        print()
+            logger.info("  ⚠️ File was auto-repaired due to corruption")
+        logger.info("")
         
         # Parse time windows
         try:
             time_windows = [int(w.strip()) for w in args.time_windows.split(',') if w.strip()]
             if not time_windows:
                 raise ValueError("No time windows specified")
-            print(f"Time windows: {time_windows} hours")
+            logger.info(f"Time windows: {time_windows} hours")
         except ValueError as e:
-            print(f"Error parsing time windows: {e}")
+            logger.error(f"Error parsing time windows: {e}")
             return 1
         
         # Get filtered data
         data = self.csv_parser.get_filtered_data(args.exclude_resolved)
         if args.exclude_resolved:
-            print(f"Excluding resolved tickets. Analyzing {len(data)} tickets.")
+            logger.info(f"Excluding resolved tickets. Analyzing {len(data)} tickets.")
         else:
-            print(f"Including all tickets. Analyzing {len(data)} tickets.")
+            logger.info(f"Including all tickets. Analyzing {len(data)} tickets.")
         
         if data.empty:
-            print("No tickets to analyze after applying filters.")
+            logger.info("No tickets to analyze after applying filters.")
             return 1
         
-        print(f"Similarity threshold: {args.similarity}%")
-        print()
+        logger.info(f"Similarity threshold: {args.similarity}%")
+        logger.info("")
         
         # Run analysis
-        print("Running duplicate detection analysis...")
+        logger.info("Running duplicate detection analysis...")
+        from duplicate_detector import DuplicateDetector
         self.duplicate_detector = DuplicateDetector(self.progress_callback)
         
-        results = self.duplicate_detector.analyze(data, time_windows, args.similarity)
+        # Per-window results; also feeds get_summary_stats() and export_results()
+        results = self.duplicate_detector.analyze_legacy(data, time_windows, args.similarity)
         
         # Display results
-        self.display_results(results)
+        counts = {time_window: len(duplicates) for time_window, duplicates in results.items()}
+        self.display_results(results, counts)
         
         # Export if requested
         if args.output:
-            print(f"\nExporting results to: {args.output}")
+            logger.info(f"\nExporting results to: {args.output}")
             df = self.duplicate_detector.export_results()
+            if self.export_manager is None:
+                from export_manager import ExportManager
+                self.export_manager = ExportManager()
             success, message = self.export_manager.export_data(df, args.output)
             
             if success:
-                print(f"✓ {message}")
+                logger.info(f"✓ {message}")
             else:
-                print(f"✗ Export failed: {message}")
+                logger.error(f"✗ Export failed: {message}")
                 return 1
         
         # Cleanup temporary files
@@ -96,27 +113,34 @@ class DuplicateTicketCLI:
         return 0
     
     def progress_callback(self, message: str, current: int, total: int):
-        """Handle progress updates."""
-        percent = (current / total) * 100 if total > 0 else 0
-        print(f"\r{message} [{percent:.1f}%]", end="", flush=True)
+        """Handle progress updates, redrawing at most every PROGRESS_INTERVAL seconds."""
+        now = time.monotonic()
+        if current != total and now - self._last_progress_time < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress_time = now
         
+        percent = (current / total) * 100 if total > 0 else 0
+        line = f"\r{message} [{percent:.1f}%]"
         if current == total:
-            print()  # New line when complete
+            line += "\n"  # New line when complete
+        
+        sys.stdout.write(line)
+        sys.stdout.flush()
     
     def repair_progress_callback(self, message: str):
         """Handle repair progress updates."""
-        print(f"  {message}")
+        logger.info(f"  {message}")
     
     def repair_only_mode(self, args):
         """Run in repair-only mode to fix a corrupted CSV file."""
-        print("CSV Repair Mode")
-        print("=" * 30)
+        logger.info("CSV Repair Mode")
+        logger.info("=" * 30)
         
         if not os.path.exists(args.input):
-            print(f"Error: File '{args.input}' does not exist.")
+            logger.error(f"Error: File '{args.input}' does not exist.")
             return 1
         
-        print(f"Repairing CSV file: {args.input}")
+        logger.info(f"Repairing CSV file: {args.input} (~{self.csv_parser.quick_row_count(args.input)} rows)")
         
         success, message, output_path = self.csv_parser.manual_repair(
             args.input,
@@ -126,69 +150,91 @@ class DuplicateTicketCLI:
         )
         
         if success:
-            print(f"✓ {message}")
+            logger.info(f"✓ {message}")
             if output_path:
-                print(f"  Output file: {output_path}")
+                logger.info(f"  Output file: {output_path}")
             return 0
         else:
-            print(f"✗ Repair failed: {message}")
+            logger.error(f"✗ Repair failed: {message}")
             return 1
     
-    def display_results(self, results):
-        """Display analysis results in terminal."""
-        print("\nAnalysis Results")
-        print("=" * 50)
+    def display_results(self, results, counts):
+        """
+        Display analysis results in terminal.
+        
+        Args:
+            results: Dictionary with time windows as keys and lists of duplicate pairs as values
+            counts: Number of duplicate pairs per time window
+        """
+        logger.info("\nAnalysis Results")
+        logger.info("=" * 50)
         
-        total_duplicates = sum(len(duplicates) for duplicates in results.values())
+        total_duplicates = sum(counts.values())
         
         if total_duplicates == 0:
-            print("No potential duplicates found.")
+            logger.info("No potential duplicates found.")
             return
         
-        print(f"Found {total_duplicates} potential duplicate pairs\n")
+        logger.info(f"Found {total_duplicates} potential duplicate pairs\n")
         
         # Display summary for each time window
-        for time_window in sorted(results.keys()):
-            duplicates = results[time_window]
-            if not duplicates:
+        for time_window in sorted(counts):
+            count = counts[time_window]
+            if not count:
                 continue
-                
-            print(f"Within {time_window} hours: {len(duplicates)} pairs")
             
-            if args.verbose:
-                print("-" * 40)
+            duplicates = results[time_window]
+            logger.info(f"Within {time_window} hours: {count} pairs")
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                # Build the whole block first and emit it as a single record
+                lines = ["-" * 40]
                 
                 # Show top matches
-                top_matches = duplicates[:min(5, len(duplicates))]
-                for i, dup in enumerate(top_matches, 1):
-                    print(f"  {i}. {dup['similarity_score']}% similarity")
-                    print(f"     Site: {dup['site']}")
-                    print(f"     Ticket 1: {dup['ticket1_number']} ({dup['ticket1_created']})")
-                    print(f"     Description: {dup['ticket1_description'][:80]}...")
-                    print(f"     Ticket 2: {dup['ticket2_number']} ({dup['ticket2_created']})")
-                    print(f"     Description: {dup['ticket2_description'][:80]}...")
-                    print(f"     Time difference: {dup['time_difference_formatted']}")
-                    print()
+                for i, dup in enumerate(duplicates[:5], 1):
+                    lines += [
+                        f"  {i}. {dup['similarity_score']}% similarity",
+                        f"     Site: {dup['site']}",
+                        f"     Ticket 1: {dup['ticket1_number']} ({dup['ticket1_created']})",
+                        f"     Description: {dup['ticket1_description'][:80]}...",
+                        f"     Ticket 2: {dup['ticket2_number']} ({dup['ticket2_created']})",
+                        f"     Description: {dup['ticket2_description'][:80]}...",
+                        f"     Time difference: {dup['time_difference_formatted']}",
+                        ""
+                    ]
                 
-                if len(duplicates) > 5:
-                    print(f"  ... and {len(duplicates) - 5} more pairs")
-                print()
+                if count > 5:
+                    lines.append(f"  ... and {count - 5} more pairs")
+                lines.append("")
+                logger.debug("\n".join(lines))
         
         # Show summary statistics
         stats = self.duplicate_detector.get_summary_stats()
-        print("Summary Statistics:")
-        print("-" * 20)
+        logger.info("Summary Statistics:")
+        logger.info("-" * 20)
         
         for time_window, stat in stats.items():
             if stat['total_pairs'] > 0:
-                print(f"Within {time_window}h:")
-                print(f"  - Duplicate pairs: {stat['total_pairs']}")
-                print(f"  - Affected sites: {stat['affected_sites']}")
-                print(f"  - Unique tickets involved: {stat['unique_tickets_involved']}")
-                print(f"  - Average similarity: {stat['avg_similarity']:.1f}%")
+                logger.info(f"Within {time_window}h:")
+                logger.info(f"  - Duplicate pairs: {stat['total_pairs']}")
+                logger.info(f"  - Affected sites: {stat['affected_sites']}")
+                logger.info(f"  - Unique tickets involved: {stat['unique_tickets_involved']}")
+                logger.info(f"  - Average similarity: {stat['avg_similarity']:.1f}%")
 
-def main():
-    """Main entry point."""
+def configure_logging(verbose: bool = False):
+    """Send CLI output through a single stdout handler; verbose enables detailed results."""
+    # Replace any handler from an earlier call so repeated runs don't print lines twice
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Detect duplicate tickets from ServiceNow CSV exports",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -208,7 +254,7 @@ Examples:
                        help="Comma-separated time windows in hours (default: 1,8,24,72)")
     parser.add_argument("-s", "--similarity", type=int, default=85, 
                        help="Similarity threshold percentage (default: 85)")
-    parser.add_argument("-o", "--output", help="Output file path for results (CSV or Excel)")
+    parser.add_argument("-o", "--output", help="Output file path for results (CSV, Excel, Parquet or Feather)")
     parser.add_argument("--exclude-resolved", action="store_true",
                        help="Exclude tickets that have been resolved")
     parser.add_argument("-v", "--verbose", action="store_true",
@@ -220,28 +266,39 @@ Examples:
     parser.add_argument("--no-auto-repair", action="store_true", 
                        help="Disable automatic repair of corrupted CSV files")
     parser.add_argument("--create-backup", action="store_true", default=True,
-                       help="Create backup when repairing (default: enabled)")
+                       help="Back up the original when overwriting it (default: enabled)")
     parser.add_argument("--overwrite-original", action="store_true",
                        help="Overwrite the original file when repairing")
     parser.add_argument("--encoding", default="utf-8",
                        help="Target encoding for repaired files (default: utf-8)")
+    parser.add_argument("--version", action="version",
+                       version=f"%(prog)s {__version__}")
+    
+    return parser
+
+def main():
+    """Main entry point."""
+    parser = build_parser()
+    
+    # Nothing to analyze: show help and exit before any CLI setup
+    if len(sys.argv) == 1:
+        parser.print_help()
+        return 0
     
     args = parser.parse_args()
     
+    configure_logging(args.verbose)
+    
     # Validate input file
     if not os.path.exists(args.input):
-        print(f"Error: Input file '{args.input}' does not exist.")
+        logger.error(f"Error: Input file '{args.input}' does not exist.")
         return 1
     
     # Validate similarity threshold
     if not 50 <= args.similarity <= 100:
-        print("Error: Similarity threshold must be between 50 and 100.")
+        logger.error("Error: Similarity threshold must be between 50 and 100.")
         return 1
     
-    # Store verbose flag globally for display_results
-    global verbose_flag
-    verbose_flag = args.verbose
-    
     try:
         cli = DuplicateTicketCLI()
         
@@ -251,80 +308,14 @@ Examples:
         else:
             return cli.run(args)
     except KeyboardInterrupt:
-        print("\nOperation cancelled by user.")
+        logger.info("\nOperation cancelled by user.")
         return 1
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        logger.error(f"Unexpected error: {e}")
         if args.verbose:
             import traceback
             traceback.print_exc()
         return 1
 
 if __name__ == "__main__":
-    # Make verbose flag accessible to display_results method
-    verbose_flag = False
-    # Monkey patch to fix verbose access
-    def display_results_with_verbose(self, results):
-        global verbose_flag
-        args = type('Args', (), {'verbose': verbose_flag})()
-        return self.display_results_original(results, args)
-    
-    # Save original method
-    DuplicateTicketCLI.display_results_original = DuplicateTicketCLI.display_results
-    
-    # Replace with patched version
-    def patched_display_results(self, results):
-        print("\nAnalysis Results")
-        print("=" * 50)
-        
-        total_duplicates = sum(len(duplicates) for duplicates in results.values())
-        
-        if total_duplicates == 0:
-            print("No potential duplicates found.")
-            return
-        
-        print(f"Found {total_duplicates} potential duplicate pairs\n")
-        
-        # Display summary for each time window
-        for time_window in sorted(results.keys()):
-            duplicates = results[time_window]
-            if not duplicates:
-                continue
-                
-            print(f"Within {time_window} hours: {len(duplicates)} pairs")
-            
-            if verbose_flag:
-                print("-" * 40)
-                
-                # Show top matches
-                top_matches = duplicates[:min(5, len(duplicates))]
-                for i, dup in enumerate(top_matches, 1):
-                    print(f"  {i}. {dup['similarity_score']}% similarity")
-                    print(f"     Site: {dup['site']}")
-                    print(f"     Ticket 1: {dup['ticket1_number']} ({dup['ticket1_created']})")
-                    print(f"     Description: {dup['ticket1_description'][:80]}...")
-                    print(f"     Ticket 2: {dup['ticket2_number']} ({dup['ticket2_created']})")
-                    print(f"     Description: {dup['ticket2_description'][:80]}...")
-                    print(f"     Time difference: {dup['time_difference_formatted']}")
-                    print()
-                
-                if len(duplicates) > 5:
-                    print(f"  ... and {len(duplicates) - 5} more pairs")
-                print()
-        
-        # Show summary statistics
-        stats = self.duplicate_detector.get_summary_stats()
-        print("Summary Statistics:")
-        print("-" * 20)
-        
-        for time_window, stat in stats.items():
-            if stat['total_pairs'] > 0:
-                print(f"Within {time_window}h:")
-                print(f"  - Duplicate pairs: {stat['total_pairs']}")
-                print(f"  - Affected sites: {stat['affected_sites']}")
-                print(f"  - Unique tickets involved: {stat['unique_tickets_involved']}")
-                print(f"  - Average similarity: {stat['avg_similarity']:.1f}%")
-    
-    DuplicateTicketCLI.display_results = patched_display_results
-    
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
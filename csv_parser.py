@@ -1,23 +1,47 @@
+import csv
+import io
+import mmap
+import numpy as np
 import pandas as pd
 import datetime
 import os
 from typing import Tuple, Optional
-from csv_repair import CSVRepairer
+
+try:
+    import pyarrow
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+    PARSE_ERRORS = (UnicodeDecodeError, pd.errors.ParserError, pyarrow.ArrowInvalid)
+except ImportError:
+    HAS_PYARROW = False
+    PARSE_ERRORS = (UnicodeDecodeError, pd.errors.ParserError)
 
 class CSVParser:
     """Handles CSV file loading, validation, and preprocessing for ServiceNow ticket data."""
     
     REQUIRED_COLUMNS = ['Site', 'Number', 'Short description', 'Created']
-    OPTIONAL_COLUMNS = ['Resolved']
+    # Resolved drives filtering; the rest feed the enhanced (Excel-only) analyses
+    OPTIONAL_COLUMNS = ['Resolved', 'Category', 'Subcategory', 'Priority']
     DATE_FORMAT = '%d-%b-%Y %H:%M:%S'
+    NAT_NS = np.iinfo(np.int64).min
     
     def __init__(self, repair_callback=None):
         self.data = None
         self.original_data = None
-        self.csv_repairer = CSVRepairer(progress_callback=repair_callback)
+        self._repair_callback = repair_callback
+        self._csv_repairer = None
         self.was_repaired = False
         self.repaired_file_path = None
+        self._unresolved_mask = None
         
+    @property
+    def csv_repairer(self):
+        """CSV repairer, created on first use so clean files never load the repair module."""
+        if self._csv_repairer is None:
+            from csv_repair import CSVRepairer
+            self._csv_repairer = CSVRepairer(progress_callback=self._repair_callback)
+        return self._csv_repairer
+    
     def load_and_validate(self, file_path: str, auto_repair: bool = True) -> Tuple[bool, str]:
         """
         Load CSV file and validate required columns, with optional auto-repair.
@@ -29,46 +53,54 @@ class CSVParser:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        working_file_path = file_path
-        
         try:
+            parse_failed = False
+            
             # First attempt: try to load the file directly
             try:
-                self.original_data = pd.read_csv(file_path, encoding='utf-8')
+                self.original_data = self._read_csv(file_path)
                 success, validation_msg = self._validate_required_columns()
                 if success:
                     # File loaded successfully without repair
                     self._finalize_loading()
-                    return True, f"Successfully loaded {len(self.data)} tickets from {len(self.data['Site'].unique())} unique sites."
+                    return True, f"Successfully loaded {len(self.data)} tickets from {self.data['Site'].nunique()} unique sites."
                 else:
                     # File loads but missing required columns
                     if not auto_repair:
                         return False, f"File validation failed: {validation_msg}"
                     # Continue to repair section to see if repair can fix column issues
                     
-            except (UnicodeDecodeError, pd.errors.ParserError) as e:
+            except PARSE_ERRORS as e:
                 # File has encoding or parsing issues
                 if not auto_repair:
                     return False, f"File corrupted and auto-repair disabled: {str(e)}"
+                parse_failed = True
                 # Continue to repair section
                 
             # Second attempt: try auto-repair if enabled and needed
             if auto_repair:
-                was_repaired, repair_message, repaired_path = self.csv_repairer.quick_repair_if_needed(file_path)
+                # Repair in memory so the repaired data never round-trips through disk
+                was_repaired, repair_message, repaired = self.csv_repairer.quick_repair_if_needed(
+                    file_path, in_memory=True, known_corrupt=parse_failed
+                )
                 
-                if was_repaired and repaired_path:
+                if was_repaired and repaired:
                     self.was_repaired = True
-                    self.repaired_file_path = repaired_path
-                    working_file_path = repaired_path
+                    if isinstance(repaired, (bytes, bytearray)):
+                        repaired_source = io.BytesIO(repaired)
+                    else:
+                        self.repaired_file_path = repaired
+                        repaired_source = repaired
                     
-                    # Try to load the repaired file
+                    # Try to load the repaired data
                     try:
-                        self.original_data = pd.read_csv(working_file_path, encoding='utf-8')
+                        self.original_data = pd.read_csv(repaired_source, encoding='utf-8',
+                                                         usecols=self._is_wanted_column)
                         success, validation_msg = self._validate_required_columns()
                         
                         if success:
                             self._finalize_loading()
-                            return True, f"Auto-repaired and loaded: {len(self.data)} tickets from {len(self.data['Site'].unique())} unique sites. ({repair_message})"
+                            return True, f"Auto-repaired and loaded: {len(self.data)} tickets from {self.data['Site'].nunique()} unique sites. ({repair_message})"
                         else:
                             return False, f"Repaired file still invalid: {validation_msg}"
                             
@@ -90,6 +122,51 @@ class CSVParser:
         except Exception as e:
             return False, f"Unexpected error loading CSV: {str(e)}"
     
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """
+        Read a UTF-8 CSV file, using the multi-threaded pyarrow reader when available.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Returns:
+            DataFrame with the file contents
+        """
+        if not HAS_PYARROW:
+            return pd.read_csv(file_path, encoding='utf-8', usecols=self._is_wanted_column)
+        
+        # pyarrow only accepts an explicit column list, so take it from the header
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f), [])
+        
+        try:
+            table = pa_csv.read_csv(
+                file_path,
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=[col for col in header if self._is_wanted_column(col)],
+                    strings_can_be_null=True
+                )
+            )
+        except pyarrow.ArrowInvalid as e:
+            # Report empty files the same way pandas does
+            if 'Empty CSV file' in str(e):
+                raise pd.errors.EmptyDataError(str(e))
+            # pyarrow rejects rows with a different field count, which pandas pads
+            # with NaN; let pandas read those files rather than sending them to repair
+            return pd.read_csv(file_path, encoding='utf-8', usecols=self._is_wanted_column)
+        
+        # Columns with invalid UTF-8 come back as binary; treat them as a
+        # decoding failure so the repair path can re-encode the file
+        if any(pyarrow.types.is_binary(field.type) for field in table.schema):
+            raise pyarrow.ArrowInvalid("CSV contains invalid UTF-8 data")
+        
+        return table.to_pandas()
+    
+    def _is_wanted_column(self, column: str) -> bool:
+        """Column filter for pd.read_csv so unused export columns are never materialized."""
+        return column in self.REQUIRED_COLUMNS or column in self.OPTIONAL_COLUMNS
+    
     def _validate_required_columns(self) -> Tuple[bool, str]:
         """Validate that required columns are present."""
         if self.original_data is None:
@@ -106,14 +183,26 @@ class CSVParser:
         return True, "All required columns present"
     
     def _finalize_loading(self):
-        """Finalize the loading process by creating working copy and parsing dates."""
-        # Make a working copy
-        self.data = self.original_data.copy()
+        """Finalize the loading process by adopting the loaded frame and parsing dates."""
+        # The raw frame is only needed for column validation, so work on it
+        # directly instead of keeping a second full copy in memory
+        self.data = self.original_data
+        self.original_data = None
+        
+        # Sites repeat heavily, so store them as categorical codes for cheap grouping
+        self.data['Site'] = self.data['Site'].astype('category')
         
         # Parse and validate the Created column
         success, message = self._parse_created_column()
         if not success:
             raise ValueError(message)
+        
+        # Tickets without a Resolved value, computed once for filtering and summaries
+        if 'Resolved' in self.data.columns:
+            resolved = self.data['Resolved']
+            self._unresolved_mask = (resolved.isna() | (resolved == '')).to_numpy()
+        else:
+            self._unresolved_mask = None
     
     def _parse_created_column(self) -> Tuple[bool, str]:
         """
@@ -124,7 +213,11 @@ class CSVParser:
         """
         try:
             # Convert Created column to datetime, allowing errors to create NaT
-            self.data['Created_dt'] = pd.to_datetime(self.data['Created'], format=self.DATE_FORMAT, errors='coerce')
+            self.data['Created_dt'] = pd.to_datetime(self.data['Created'], format=self.DATE_FORMAT,
+                                                     errors='coerce', cache=True)
+            
+            # Integer nanoseconds since epoch for cheap time-difference arithmetic (NaT becomes NAT_NS)
+            self.data['Created_ns'] = self.data['Created_dt'].to_numpy(dtype='datetime64[ns]').view('i8')
             
             # Check for any parsing failures (NaT values)
             failed_parsing = self.data['Created_dt'].isna().sum()
@@ -151,18 +244,49 @@ class CSVParser:
             exclude_resolved: Whether to exclude tickets with resolved dates
             
         Returns:
-            Filtered DataFrame
+            Filtered DataFrame (the loaded frame itself when no filter applies,
+            so callers must not modify it in place)
         """
         if self.data is None:
             return pd.DataFrame()
         
-        filtered_data = self.data.copy()
-        
-        if exclude_resolved and 'Resolved' in filtered_data.columns:
+        if exclude_resolved and self._unresolved_mask is not None:
             # Exclude tickets that have a non-empty Resolved field
-            filtered_data = filtered_data[filtered_data['Resolved'].isna() | (filtered_data['Resolved'] == '')]
+            return self.data[self._unresolved_mask]
         
-        return filtered_data
+        return self.data
+    
+    def get_created_ns_array(self) -> np.ndarray:
+        """
+        Get creation times as int64 nanoseconds since the epoch.
+        
+        Time differences can be computed with integer arithmetic on this array,
+        e.g. ``t[j] - t[i] <= hours * 3_600_000_000_000``. Unparseable dates are
+        stored as ``NAT_NS``.
+        
+        Returns:
+            int64 array aligned with the loaded data
+        """
+        if self.data is None:
+            return np.empty(0, dtype=np.int64)
+        return self.data['Created_ns'].to_numpy()
+    
+    def get_site_codes(self) -> np.ndarray:
+        """
+        Get the integer category code of each ticket's site.
+        
+        Returns:
+            Array of codes aligned with the loaded data (-1 for a missing site)
+        """
+        if self.data is None:
+            return np.empty(0, dtype=np.int16)
+        return self.data['Site'].cat.codes.to_numpy()
+    
+    def get_site_categories(self) -> pd.Index:
+        """Get the site names indexed by the codes from get_site_codes()."""
+        if self.data is None:
+            return pd.Index([])
+        return self.data['Site'].cat.categories
     
     def get_sites(self) -> list:
         """Get list of unique sites in the data."""
@@ -181,17 +305,51 @@ class CSVParser:
         if self.data is None:
             return {}
         
+        # Date range straight from the int64 buffer, skipping unparseable dates
+        created_ns = self.get_created_ns_array()
+        created_ns = created_ns[created_ns != self.NAT_NS]
+        if created_ns.size:
+            earliest, latest = pd.Timestamp(created_ns.min()), pd.Timestamp(created_ns.max())
+        else:
+            earliest = latest = pd.NaT
+        
         return {
             'total_tickets': len(self.data),
-            'unique_sites': len(self.data['Site'].unique()),
+            'unique_sites': self.data['Site'].nunique(),
             'date_range': {
-                'earliest': self.data['Created_dt'].min(),
-                'latest': self.data['Created_dt'].max()
+                'earliest': earliest,
+                'latest': latest
             },
-            'resolved_tickets': len(self.data[self.data['Resolved'].notna() & (self.data['Resolved'] != '')]) if 'Resolved' in self.data.columns else 0,
+            'resolved_tickets': int((~self._unresolved_mask).sum()) if self._unresolved_mask is not None else 0,
             'was_repaired': self.was_repaired
         }
     
+    def quick_row_count(self, file_path: str, block_size: int = 1 << 20) -> int:
+        """
+        Estimate the number of data rows without parsing the file.
+        
+        Counts line breaks through a read-only memory map, one block at a time,
+        so memory use stays flat even for very large exports. Quoted values that
+        span several lines are counted once per line.
+        
+        Args:
+            file_path: Path to the CSV file
+            block_size: Bytes to scan per step
+            
+        Returns:
+            Number of lines after the header
+        """
+        if os.path.getsize(file_path) == 0:
+            return 0
+        
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            lines = sum(mm[start:start + block_size].count(b'\n') for start in range(0, size, block_size))
+            if mm[size - 1:size] != b'\n':
+                lines += 1  # Last line has no trailing newline
+        
+        return max(lines - 1, 0)
+    
     def cleanup_temp_files(self):
         """Clean up any temporary repaired files created during processing."""
         if self.repaired_file_path and os.path.exists(self.repaired_file_path):
@@ -1,32 +1,105 @@
+from __future__ import annotations
+
+import codecs
+import functools
+import importlib
+import io
 import os
 import shutil
-import pandas as pd
-from typing import Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional, Union
 from datetime import datetime
 
-try:
-    import chardet
-    HAS_CHARDET = True
-except ImportError:
-    HAS_CHARDET = False
+# Prefer compiled encoding detectors; all of them expose a chardet-compatible detect()
+detect_charset = None
+for _detector_module in ('cchardet', 'charset_normalizer', 'chardet'):
+    try:
+        detect_charset = importlib.import_module(_detector_module).detect
+        break
+    except ImportError:
+        continue
+
+HAS_CHARDET = detect_charset is not None
+if not HAS_CHARDET:
     print("Warning: chardet not available. Using basic encoding detection.")
 
+# pandas, numpy and pyarrow are imported on first use by _load_dataframe_libs(),
+# so importing this module (e.g. only to sniff encodings) stays cheap
+pd = None
+np = None
+pyarrow = None
+pa_csv = None
+HAS_PYARROW = False
+
+def _load_dataframe_libs():
+    """Import pandas, numpy and (if installed) pyarrow into the module namespace."""
+    global pd, np, pyarrow, pa_csv, HAS_PYARROW
+    if pd is not None:
+        return
+    
+    import numpy
+    import pandas
+    np, pd = numpy, pandas
+    
+    try:
+        import pyarrow as _pyarrow
+        import pyarrow.csv as _pa_csv
+        pyarrow, pa_csv = _pyarrow, _pa_csv
+        HAS_PYARROW = True
+    except ImportError:
+        HAS_PYARROW = False
+
+def _repair_one(filepath: str, create_backup: bool, target_encoding: str,
+                overwrite: bool) -> Tuple[bool, str, Optional[str]]:
+    """Repair a single file in a worker process (module-level so it can be pickled)."""
+    return CSVRepairer().repair_csv(filepath, create_backup=create_backup,
+                                    target_encoding=target_encoding, overwrite=overwrite)
+
 class CSVRepairer:
     """CSV repair functionality for fixing corrupted or malformed CSV files."""
     
+    # Files above this size are repaired in chunks instead of being loaded whole
+    LARGE_FILE_BYTES = 200 * 1024 * 1024
+    CHUNK_ROWS = 100_000
+    
     def __init__(self, progress_callback=None):
         self.progress_callback = progress_callback
+        # Detected encodings keyed by (path, mtime, size) so each file is sniffed once
+        self._encoding_cache = {}
         
     def detect_encoding(self, filepath: str) -> str:
         """Detect the encoding of a CSV file."""
+        try:
+            stat = os.stat(filepath)
+            cache_key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+        
+        if cache_key in self._encoding_cache:
+            return self._encoding_cache[cache_key]
+        
+        encoding = self._detect_encoding_uncached(filepath)
+        if cache_key is not None:
+            self._encoding_cache[cache_key] = encoding
+        return encoding
+    
+    def _detect_encoding_uncached(self, filepath: str) -> str:
+        """Sniff the encoding of a CSV file from its leading bytes."""
+        # Most files are settled by a BOM or a clean UTF-8 head; only sniff the rest
+        encoding = self._quick_detect_encoding(filepath)
+        if encoding:
+            if self.progress_callback:
+                self.progress_callback(f"Detected encoding: {encoding}")
+            return encoding
+        
         if HAS_CHARDET:
             try:
                 with open(filepath, 'rb') as f:
                     raw_data = f.read(10000)  # Read first 10KB for detection
                 
-                result = chardet.detect(raw_data)
+                result = detect_charset(raw_data)
                 encoding = result['encoding']
-                confidence = result['confidence']
+                confidence = result['confidence'] or 0.0
                 
                 if self.progress_callback:
                     self.progress_callback(f"Detected encoding: {encoding} (confidence: {confidence:.2f})")
@@ -36,16 +109,53 @@ class CSVRepairer:
             except Exception:
                 return 'utf-8'
         else:
-            # Fallback: try common encodings
-            encodings_to_try = ['utf-8', 'windows-1252', 'iso-8859-1']
-            for encoding in encodings_to_try:
-                try:
-                    with open(filepath, 'r', encoding=encoding) as f:
-                        f.read(1000)  # Try to read first 1KB
-                    return encoding
-                except UnicodeDecodeError:
-                    continue
+            # Fallback: the quick check already ruled out UTF-8, so decode one sample
+            # as windows-1252; ISO-8859-1 maps every byte, including the five
+            # windows-1252 leaves undefined
+            try:
+                with open(filepath, 'rb') as f:
+                    sample = f.read(4096)
+            except OSError:
+                return 'utf-8'
+            
+            try:
+                sample.decode('windows-1252')
+                return 'windows-1252'
+            except UnicodeDecodeError:
+                return 'iso-8859-1'
+    
+    def _quick_detect_encoding(self, filepath: str, sample_size: int = 4096) -> Optional[str]:
+        """
+        Cheaply identify BOM-marked and UTF-8 files from the start of the file.
+        
+        Args:
+            filepath: Path to the CSV file
+            sample_size: Number of leading bytes to inspect
+            
+        Returns:
+            Encoding name, or None if the sample is not conclusive
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                head = f.read(sample_size)
+        except OSError:
+            return None
+        
+        if head.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'utf-16'
+        
+        # Plain ASCII (most ServiceNow exports) is valid UTF-8; isascii() is a single C scan
+        if head.isascii():
+            return 'utf-8'
+        
+        try:
+            # Incremental decode tolerates a multi-byte character cut off at the sample boundary
+            codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
             return 'utf-8'
+        except UnicodeDecodeError:
+            return None
     
     def repair_csv(self, filepath: str, create_backup: bool = True, 
                    target_encoding: str = 'utf-8', overwrite: bool = False) -> Tuple[bool, str, Optional[str]]:
@@ -54,70 +164,27 @@ class CSVRepairer:
         
         Args:
             filepath: Path to the CSV file to repair
-            create_backup: Whether to create a backup of the original file
+            create_backup: Whether to back up the original file before overwriting it
             target_encoding: Target encoding for the output file
             overwrite: Whether to overwrite the original file
             
         Returns:
             Tuple of (success: bool, message: str, output_path: Optional[str])
         """
+        _load_dataframe_libs()
+        
         try:
             if self.progress_callback:
                 self.progress_callback(f"Repairing: {os.path.basename(filepath)}")
             
-            # Detect current encoding
-            current_encoding = self.detect_encoding(filepath)
-            
-            # Create backup if requested
-            if create_backup and not overwrite:
+            # Back up the original only when it is about to be overwritten; a
+            # separate _repaired output already leaves it untouched
+            if create_backup and overwrite:
                 backup_path = filepath + '.bak'
-                shutil.copy2(filepath, backup_path)
+                shutil.copy(filepath, backup_path)
                 if self.progress_callback:
                     self.progress_callback(f"Backup created: {os.path.basename(backup_path)}")
             
-            # Try to read the CSV with various encodings
-            encodings_to_try = [current_encoding, 'utf-8', 'windows-1252', 'iso-8859-1', 'latin-1']
-            df = None
-            successful_encoding = None
-            
-            for encoding in encodings_to_try:
-                try:
-                    df = pd.read_csv(filepath, encoding=encoding, on_bad_lines='skip')
-                    successful_encoding = encoding
-                    if self.progress_callback:
-                        self.progress_callback(f"Successfully read with {encoding} encoding")
-                    break
-                except (UnicodeDecodeError, pd.errors.ParserError) as e:
-                    continue
-                except Exception as e:
-                    if self.progress_callback:
-                        self.progress_callback(f"Failed to read with {encoding}: {str(e)[:100]}")
-                    continue
-            
-            if df is None:
-                return False, "Failed to read file with any encoding", None
-            
-            # Clean and validate data
-            original_rows = len(df)
-            original_columns = len(df.columns)
-            
-            # Remove completely empty rows
-            df = df.dropna(how='all')
-            
-            # Remove duplicate rows (but be conservative about this)
-            df_before_dedup = len(df)
-            df = df.drop_duplicates()
-            
-            cleaned_rows = len(df)
-            duplicates_removed = df_before_dedup - cleaned_rows
-            
-            # Strip whitespace from string columns
-            string_columns = df.select_dtypes(include=['object']).columns
-            for col in string_columns:
-                df[col] = df[col].astype(str).str.strip()
-                # Replace 'nan' strings with actual NaN
-                df[col] = df[col].replace('nan', pd.NA)
-            
             # Determine output path
             if overwrite:
                 output_path = filepath
@@ -125,26 +192,94 @@ class CSVRepairer:
                 base, ext = os.path.splitext(filepath)
                 output_path = f"{base}_repaired{ext}"
             
-            # Write the repaired file
-            df.to_csv(output_path, index=False, encoding=target_encoding)
+            if os.path.getsize(filepath) > self.LARGE_FILE_BYTES:
+                # Stream large files chunk by chunk to keep memory bounded
+                stats = self._repair_large_csv(filepath, output_path, target_encoding)
+                if stats is None:
+                    return False, "Failed to read file with any encoding", None
+            else:
+                df, stats = self._read_and_clean(filepath)
+                if df is None:
+                    return False, "Failed to read file with any encoding", None
+                
+                # Write the repaired file
+                self._write_csv(df, output_path, target_encoding)
+            
+            message = self._repair_summary(stats, target_encoding)
+            
+            if self.progress_callback:
+                self.progress_callback(message)
+            
+            return True, message, output_path
+            
+        except Exception as e:
+            error_msg = f"Error repairing CSV: {str(e)}"
+            if self.progress_callback:
+                self.progress_callback(f"✗ {error_msg}")
+            return False, error_msg, None
+    
+    def repair_many(self, filepaths: List[str], create_backup: bool = True,
+                    target_encoding: str = 'utf-8', overwrite: bool = False,
+                    workers: Optional[int] = None) -> List[Tuple[bool, str, Optional[str]]]:
+        """
+        Repair several CSV files in parallel, one worker process per file.
+        
+        Args:
+            filepaths: Paths of the CSV files to repair
+            create_backup: Whether to back up each original file before overwriting it
+            target_encoding: Target encoding for the output files
+            overwrite: Whether to overwrite the original files
+            workers: Maximum number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List of (success: bool, message: str, output_path: Optional[str]) in input order
+        """
+        if len(filepaths) <= 1 or workers == 1:
+            return [self.repair_csv(path, create_backup, target_encoding, overwrite) for path in filepaths]
+        
+        results = []
+        repair = functools.partial(_repair_one, create_backup=create_backup,
+                                   target_encoding=target_encoding, overwrite=overwrite)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for filepath, result in zip(filepaths, executor.map(repair, filepaths)):
+                # Workers cannot reach the callback, so report each file as it completes
+                if self.progress_callback:
+                    self.progress_callback(f"{os.path.basename(filepath)}: {result[1]}")
+                results.append(result)
+        
+        return results
+    
+    def repair_to_buffer(self, filepath: str, target_encoding: str = 'utf-8') -> Tuple[bool, str, Optional[bytes]]:
+        """
+        Repair a CSV file in memory, leaving the original untouched and writing nothing to disk.
+        
+        Args:
+            filepath: Path to the CSV file to repair
+            target_encoding: Encoding of the returned CSV bytes
+            
+        Returns:
+            Tuple of (success: bool, message: str, repaired_csv: Optional[bytes])
+        """
+        _load_dataframe_libs()
+        
+        try:
+            if self.progress_callback:
+                self.progress_callback(f"Repairing: {os.path.basename(filepath)}")
             
-            # Prepare summary message
-            changes = []
-            if original_rows != cleaned_rows:
-                changes.append(f"Rows: {original_rows} → {cleaned_rows}")
-            if duplicates_removed > 0:
-                changes.append(f"Removed {duplicates_removed} duplicates")
-            if successful_encoding != target_encoding:
-                changes.append(f"Encoding: {successful_encoding} → {target_encoding}")
+            df, stats = self._read_and_clean(filepath)
+            if df is None:
+                return False, "Failed to read file with any encoding", None
             
-            change_summary = ", ".join(changes) if changes else "No changes needed"
+            buffer = io.BytesIO()
+            self._write_csv(df, buffer, target_encoding)
+            repaired_csv = buffer.getvalue()
             
-            message = f"✓ Repaired successfully. {change_summary}. Columns: {original_columns}"
+            message = self._repair_summary(stats, target_encoding)
             
             if self.progress_callback:
                 self.progress_callback(message)
             
-            return True, message, output_path
+            return True, message, repaired_csv
             
         except Exception as e:
             error_msg = f"Error repairing CSV: {str(e)}"
@@ -152,22 +287,375 @@ class CSVRepairer:
                 self.progress_callback(f"✗ {error_msg}")
             return False, error_msg, None
     
-    def quick_repair_if_needed(self, filepath: str, target_encoding: str = 'utf-8') -> Tuple[bool, str, Optional[str]]:
+    def _read_and_clean(self, filepath: str) -> Tuple[Optional[pd.DataFrame], dict]:
+        """
+        Read a CSV file with encoding fallbacks and clean up its contents.
+        
+        Args:
+            filepath: Path to the CSV file
+            
+        Returns:
+            Tuple of (cleaned DataFrame or None if unreadable, repair statistics)
+        """
+        # Detect current encoding
+        current_encoding = self.detect_encoding(filepath)
+        
+        # Read the bytes once; each candidate encoding is then checked with a plain
+        # decode, and only a decodable buffer goes through the CSV parser. The decoded
+        # text is dropped straight away so a large file is never held twice while parsing
+        with open(filepath, 'rb') as f:
+            raw_data = f.read()
+        
+        # Try to read the CSV with various encodings
+        encodings_to_try = [current_encoding, 'utf-8', 'windows-1252', 'iso-8859-1', 'latin-1']
+        df = None
+        successful_encoding = None
+        
+        for encoding in encodings_to_try:
+            try:
+                raw_data.decode(encoding)
+            except (UnicodeDecodeError, LookupError):
+                continue
+            
+            try:
+                df = self._read_csv(io.BytesIO(raw_data), encoding)
+                successful_encoding = encoding
+                if self.progress_callback:
+                    self.progress_callback(f"Successfully read with {encoding} encoding")
+                break
+            except (UnicodeDecodeError, pd.errors.ParserError) as e:
+                continue
+            except Exception as e:
+                if self.progress_callback:
+                    self.progress_callback(f"Failed to read with {encoding}: {str(e)[:100]}")
+                continue
+        
+        if df is None:
+            return None, {}
+        
+        # Clean and validate data
+        original_rows = len(df)
+        original_columns = len(df.columns)
+        
+        # Completely empty rows
+        empty = df.isna().to_numpy().all(axis=1)
+        
+        # Store repetitive text (sites, groups, categories) as integer codes
+        df = self._categorize_repeated_columns(df)
+        
+        # Duplicate rows (but be conservative about this: only exact repeats)
+        duplicate = self._exact_duplicate_mask(df)
+        duplicates_removed = int((duplicate & ~empty).sum())
+        
+        # Drop both kinds of rows with a single selection instead of one copy per step
+        keep = ~(empty | duplicate)
+        if not keep.all():
+            df = df[keep]
+        cleaned_rows = len(df)
+        
+        # Strip whitespace from string columns
+        df = self._strip_text_columns(df)
+        
+        stats = {
+            'encoding': successful_encoding,
+            'original_rows': original_rows,
+            'original_columns': original_columns,
+            'cleaned_rows': cleaned_rows,
+            'duplicates_removed': duplicates_removed
+        }
+        return df, stats
+    
+    def _repair_large_csv(self, filepath: str, output_path: str, target_encoding: str) -> Optional[dict]:
+        """
+        Repair a large CSV file in chunks, streaming the cleaned rows to disk.
+        
+        All columns are read as text so every chunk is parsed and written the same
+        way. Duplicates across chunks are found through a set of 64-bit row hashes.
+        
+        Args:
+            filepath: Path to the CSV file
+            output_path: Path for the repaired file (may be the input file itself)
+            target_encoding: Encoding for the repaired output
+            
+        Returns:
+            Repair statistics, or None if the file could not be read with any encoding
+        """
+        current_encoding = self.detect_encoding(filepath)
+        encodings_to_try = [current_encoding, 'utf-8', 'windows-1252', 'iso-8859-1', 'latin-1']
+        
+        # Write beside the destination and swap it in once complete, so overwriting
+        # the input never truncates it while it is still being read
+        temp_path = output_path + '.tmp'
+        
+        for encoding in encodings_to_try:
+            try:
+                stats = self._stream_clean(filepath, encoding, temp_path, target_encoding)
+            except (UnicodeDecodeError, pd.errors.ParserError):
+                continue
+            except Exception as e:
+                if self.progress_callback:
+                    self.progress_callback(f"Failed to read with {encoding}: {str(e)[:100]}")
+                continue
+            
+            os.replace(temp_path, output_path)
+            if self.progress_callback:
+                self.progress_callback(f"Successfully read with {encoding} encoding")
+            return stats
+        
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+    
+    def _stream_clean(self, filepath: str, encoding: str, output_path: str, target_encoding: str) -> dict:
+        """Clean a CSV file chunk by chunk with one encoding and write the result to output_path."""
+        stats = {
+            'encoding': encoding,
+            'original_rows': 0,
+            'original_columns': 0,
+            'cleaned_rows': 0,
+            'duplicates_removed': 0
+        }
+        seen_hashes = np.empty(0, dtype=np.uint64)
+        
+        reader = pd.read_csv(filepath, encoding=encoding, dtype=str, on_bad_lines='skip',
+                             chunksize=self.CHUNK_ROWS)
+        with reader, open(output_path, 'w', encoding=target_encoding, newline='') as output:
+            for chunk_number, chunk in enumerate(reader):
+                stats['original_rows'] += len(chunk)
+                stats['original_columns'] = len(chunk.columns)
+                
+                chunk = self._drop_empty_rows(chunk)
+                
+                # Keep only the first occurrence of each row across the whole file
+                row_hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+                keep, seen_hashes = self._first_occurrences(row_hashes, seen_hashes)
+                if not keep.all():
+                    stats['duplicates_removed'] += int((~keep).sum())
+                    chunk = chunk[keep]
+                
+                chunk = self._strip_text_columns(chunk)
+                stats['cleaned_rows'] += len(chunk)
+                
+                chunk.to_csv(output, index=False, header=chunk_number == 0)
+        
+        return stats
+    
+    @staticmethod
+    def _first_occurrences(row_hashes: np.ndarray, seen_hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Flag rows whose hash has not been seen before, without a per-row Python loop.
+        
+        Args:
+            row_hashes: uint64 hashes of the rows in the current chunk
+            seen_hashes: Sorted hashes of all rows kept so far
+            
+        Returns:
+            Tuple of (boolean keep mask, updated sorted seen hashes)
+        """
+        keep = ~pd.Series(row_hashes).duplicated().to_numpy()
+        
+        if len(seen_hashes) > 0:
+            positions = np.searchsorted(seen_hashes, row_hashes)
+            positions[positions == len(seen_hashes)] = 0
+            keep &= seen_hashes[positions] != row_hashes
+        
+        # Stable sort of two sorted runs is a linear merge
+        new_hashes = np.sort(row_hashes[keep])
+        seen_hashes = np.sort(np.concatenate([seen_hashes, new_hashes]), kind='stable')
+        return keep, seen_hashes
+    
+    @staticmethod
+    def _drop_empty_rows(df: pd.DataFrame) -> pd.DataFrame:
+        """Drop rows where every value is missing, using one reduction over the NA mask."""
+        keep = ~df.isna().to_numpy().all(axis=1)
+        if keep.all():
+            return df
+        return df[keep]
+    
+    @staticmethod
+    def _strip_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """Strip surrounding whitespace from text columns; missing values stay missing."""
+        string_columns = df.select_dtypes(include=['object']).columns
+        if len(string_columns) > 0:
+            df[string_columns] = df[string_columns].astype('string').apply(lambda col: col.str.strip())
+        
+        # Categorical columns only need their distinct labels stripped
+        for col in df.select_dtypes(include=['category']).columns:
+            stripped = df[col].cat.categories.astype('string').str.strip()
+            if stripped.is_unique:
+                df[col] = df[col].cat.rename_categories(stripped)
+            else:
+                # Stripping merged some labels, so fall back to stripping the values
+                df[col] = df[col].astype('string').str.strip()
+        return df
+    
+    @staticmethod
+    def _categorize_repeated_columns(df: pd.DataFrame, max_unique_ratio: float = 0.5) -> pd.DataFrame:
+        """
+        Convert low-cardinality text columns to the category dtype.
+        
+        Args:
+            df: DataFrame to convert
+            max_unique_ratio: Largest ratio of distinct values to rows that is still converted
+            
+        Returns:
+            DataFrame with repetitive text columns stored as categories
+        """
+        for col in df.select_dtypes(include=['object']).columns:
+            # One factorize pass both measures cardinality and builds the categorical
+            codes, uniques = pd.factorize(df[col])
+            if len(uniques) < max_unique_ratio * len(df):
+                df[col] = pd.Categorical.from_codes(codes, categories=uniques)
+        return df
+    
+    @staticmethod
+    def _exact_duplicate_mask(df: pd.DataFrame) -> np.ndarray:
+        """
+        Flag fully identical rows, hashing only the ticket key columns up front.
+        
+        Rows can only be identical if their Number and Created match, so the wide
+        text columns are compared just for those candidate rows.
+        
+        Args:
+            df: DataFrame to check
+            
+        Returns:
+            Boolean array marking every repeat after a row's first occurrence
+        """
+        key_columns = [col for col in ('Number', 'Created') if col in df.columns]
+        if not key_columns:
+            return df.duplicated().to_numpy()
+        
+        exact = np.zeros(len(df), dtype=bool)
+        candidates = df.duplicated(subset=key_columns, keep=False).to_numpy()
+        if candidates.any():
+            # Scatter the full-row check for the candidates back onto every row
+            exact[candidates] = df[candidates].duplicated().to_numpy()
+        return exact
+    
+    def _read_csv(self, filepath: Union[str, io.BytesIO], encoding: str) -> pd.DataFrame:
+        """
+        Read a CSV file, using the multithreaded pyarrow engine when available.
+        
+        Args:
+            filepath: Path to the CSV file, or an in-memory buffer of its bytes
+            encoding: Encoding to decode the file with
+            
+        Returns:
+            DataFrame with short rows padded and overlong rows skipped
+        """
+        if HAS_PYARROW:
+            try:
+                df = pd.read_csv(filepath, encoding=encoding, engine='pyarrow')
+                # pyarrow hands back undecodable text as bytes instead of failing;
+                # let the C engine raise the proper UnicodeDecodeError for it
+                if not self._has_binary_columns(df):
+                    return df
+            except (ImportError, ValueError):
+                # Includes rows with a different field count: pyarrow can only drop
+                # them, while the C engine pads short rows and skips only long ones
+                pass
+            
+            if isinstance(filepath, io.BytesIO):
+                filepath.seek(0)
+        
+        return pd.read_csv(filepath, encoding=encoding, engine='c', on_bad_lines='skip')
+    
+    @staticmethod
+    def _write_csv(df: pd.DataFrame, destination: Union[str, io.BytesIO], target_encoding: str,
+                   writer: str = 'auto'):
+        """
+        Write a DataFrame as CSV, using pyarrow's native writer for UTF-8 output when available.
+        
+        Args:
+            df: DataFrame to write
+            destination: Output file path or binary buffer
+            target_encoding: Encoding for the output
+            writer: 'pyarrow', 'pandas', or 'auto' to pick pyarrow when it can be used
+        """
+        use_pyarrow = (writer != 'pandas' and HAS_PYARROW
+                       and codecs.lookup(target_encoding).name == 'utf-8'
+                       and not str(destination).endswith(('.gz', '.bz2', '.zip', '.xz', '.zst')))
+        if use_pyarrow:
+            try:
+                table = pyarrow.Table.from_pandas(df, preserve_index=False)
+                pa_csv.write_csv(table, destination, pa_csv.WriteOptions(quoting_style='needed'))
+                return
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, pyarrow.ArrowNotImplementedError):
+                # Mixed-type columns pyarrow cannot convert; fall back to pandas
+                if isinstance(destination, io.BytesIO):
+                    destination.seek(0)
+                    destination.truncate()
+        
+        if isinstance(destination, io.BytesIO):
+            destination.write(df.to_csv(index=False).encode(target_encoding))
+        else:
+            df.to_csv(destination, index=False, encoding=target_encoding)
+    
+    @staticmethod
+    def _has_binary_columns(df: pd.DataFrame) -> bool:
+        """Check whether any column holds raw bytes rather than decoded text."""
+        for col in df.select_dtypes(include=['object']).columns:
+            first_valid = df[col].first_valid_index()
+            if first_valid is not None and isinstance(df[col].loc[first_valid], bytes):
+                return True
+        return False
+    
+    @staticmethod
+    def _is_valid_utf8(filepath: str, block_size: int = 1 << 20) -> bool:
+        """Check that a file decodes as UTF-8, streaming it in blocks without parsing it."""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        try:
+            with open(filepath, 'rb') as f:
+                for block in iter(lambda: f.read(block_size), b''):
+                    decoder.decode(block)
+            decoder.decode(b'', final=True)
+            return True
+        except UnicodeDecodeError:
+            return False
+    
+    def _repair_summary(self, stats: dict, target_encoding: str) -> str:
+        """Build the user-facing summary message for a completed repair."""
+        changes = []
+        if stats['original_rows'] != stats['cleaned_rows']:
+            changes.append(f"Rows: {stats['original_rows']} → {stats['cleaned_rows']}")
+        if stats['duplicates_removed'] > 0:
+            changes.append(f"Removed {stats['duplicates_removed']} duplicates")
+        if stats['encoding'] != target_encoding:
+            changes.append(f"Encoding: {stats['encoding']} → {target_encoding}")
+        
+        change_summary = ", ".join(changes) if changes else "No changes needed"
+        
+        return f"✓ Repaired successfully. {change_summary}. Columns: {stats['original_columns']}"
+    
+    def quick_repair_if_needed(self, filepath: str, target_encoding: str = 'utf-8',
+                               in_memory: bool = False,
+                               known_corrupt: bool = False) -> Tuple[bool, str, Optional[Union[str, bytes]]]:
         """
         Quickly check if a CSV needs repair and fix it if necessary.
         This is a lightweight version for integration into the duplicate detection workflow.
         
+        Args:
+            filepath: Path to the CSV file
+            target_encoding: Encoding for the repaired output
+            in_memory: Return the repaired CSV as bytes instead of writing a temporary file
+            known_corrupt: Skip the readability check because the caller already failed to parse the file
+        
         Returns:
-            Tuple of (was_repaired: bool, message: str, repaired_file_path: Optional[str])
+            Tuple of (was_repaired: bool, message: str, repaired: Optional[str or bytes]),
+            where repaired is the repaired file path, or the repaired CSV bytes when in_memory is set
         """
+        _load_dataframe_libs()
+        
         try:
-            # First, try to read the file normally with full validation
+            # First, check the header and first row, then that the whole file is valid UTF-8
             try:
-                df = pd.read_csv(filepath, encoding='utf-8')
-                # Check if it has the basic structure we need
-                if len(df.columns) >= 4 and len(df) > 0:
-                    # File appears to be readable and has data
-                    return False, "File is already readable", filepath
+                if not known_corrupt:
+                    df = pd.read_csv(filepath, encoding='utf-8', nrows=1)
+                    # Check if it has the basic structure we need
+                    if len(df.columns) >= 4 and len(df) > 0 and self._is_valid_utf8(filepath):
+                        # File appears to be readable and has data
+                        return False, "File is already readable", filepath
             except (UnicodeDecodeError, pd.errors.ParserError):
                 # File definitely needs repair due to encoding or parsing issues
                 pass
@@ -178,6 +666,12 @@ class CSVRepairer:
             if self.progress_callback:
                 self.progress_callback("File appears corrupted, attempting repair...")
             
+            if in_memory:
+                success, message, repaired_csv = self.repair_to_buffer(filepath, target_encoding)
+                if success:
+                    return True, f"Auto-repaired: {message}", repaired_csv
+                return False, f"Auto-repair failed: {message}", None
+            
             # Repair with temporary output
             base, ext = os.path.splitext(filepath)
             temp_output = f"{base}_temp_repaired{ext}"
@@ -209,10 +703,12 @@ class CSVRepairer:
         Returns:
             Tuple of (is_valid: bool, message: str)
         """
+        _load_dataframe_libs()
+        
         try:
-            # Try to read just the header
-            df_header = pd.read_csv(filepath, nrows=0)
-            columns = df_header.columns.tolist()
+            # One small read gives both the header and a sample of rows
+            df_sample = pd.read_csv(filepath, nrows=10)
+            columns = set(df_sample.columns)
             
             # Check for required ServiceNow columns
             required_columns = ['Site', 'Number', 'Short description', 'Created']
@@ -221,9 +717,6 @@ class CSVRepairer:
             if missing_columns:
                 return False, f"Missing required columns: {', '.join(missing_columns)}"
             
-            # Try to read a few rows to check for basic structure issues
-            df_sample = pd.read_csv(filepath, nrows=10)
-            
             if len(df_sample) == 0:
                 return False, "File appears to be empty"
             
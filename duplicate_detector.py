@@ -1,20 +1,66 @@
+import numpy as np
 import pandas as pd
 from datetime import timedelta
-from typing import List, Dict, Tuple, Callable
+from typing import List, Dict, Tuple, Callable, Optional
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+import functools
 import itertools
+import os
+import sys
+from functools import lru_cache
 
-try:
-    from fuzzywuzzy import fuzz
-    HAS_FUZZYWUZZY = True
-except ImportError:
-    import difflib
-    HAS_FUZZYWUZZY = False
-    print("Warning: fuzzywuzzy not available. Using difflib for string similarity.")
-    print("For better performance, install fuzzywuzzy: pip install fuzzywuzzy python-Levenshtein")
+from rapidfuzz import fuzz, process
+
+@lru_cache(maxsize=200_000)
+def _score_descriptions(desc1_lower: str, desc2_lower: str, score_cutoff: int = 0) -> int:
+    """
+    Score two lowercased descriptions; memoized because templated tickets repeat
+    the same descriptions across many pairs.
+    
+    Args:
+        desc1_lower: First description, lowercased
+        desc2_lower: Second description, lowercased
+        score_cutoff: Scores below this may be reported as 0
+        
+    Returns:
+        Similarity score (0-100)
+    """
+    # Same scores as the batched cdist path, rounded to whole percentages; the
+    # cutoff (half a point below, the lowest score that still rounds up to it)
+    # lets RapidFuzz abandon pairs that cannot reach it
+    cutoff = max(score_cutoff - 0.5, 0)
+    return int(round(max(fuzz.ratio(desc1_lower, desc2_lower, score_cutoff=cutoff),
+                         fuzz.partial_ratio(desc1_lower, desc2_lower, score_cutoff=cutoff))))
+
+def _analyze_site_chunk(chunk: pd.DataFrame, max_hours: int, similarity_threshold: int) -> List[Dict]:
+    """Find max-timeframe duplicates for a run of whole sites in a worker process (module-level so it can be pickled)."""
+    detector = DuplicateDetector()
+    # The pool already spreads work over every core
+    detector.similarity_workers = 1
+    
+    duplicates = []
+    for _, site_data in detector._split_sites_by_time(chunk):
+        duplicates.extend(detector._find_duplicates_in_site_max_timeframe(site_data, max_hours, similarity_threshold))
+    return duplicates
 
 class DuplicateDetector:
     """Core engine for detecting potential duplicate tickets using fuzzy string matching and time windows."""
     
+    # Rows and columns of each pairwise similarity tile scored per RapidFuzz batch
+    SIMILARITY_TILE_SIZE = 256
+    
+    # Smaller inputs are analyzed in-process; worker start-up would cost more than it saves
+    PARALLEL_MIN_TICKETS = 20_000
+    
+    # Character histogram buckets for the pair prefilter, and band pairs checked per numpy batch
+    FINGERPRINT_BUCKETS = 128
+    FINGERPRINT_PAIR_BATCH = 16_384
+    
+    # Upper bounds (inclusive, in hours) of every time category but the last
+    TIME_CATEGORY_BOUNDS = [1, 4, 8, 24, 72, 168]
+    TIME_CATEGORY_LABELS = np.array(["0-1h", "1-4h", "4-8h", "8-24h", "1-3d", "3-7d", ">7d"])
+    
     def __init__(self, progress_callback: Callable[[str, int, int], None] = None):
         """
         Initialize the duplicate detector.
@@ -24,8 +70,11 @@ class DuplicateDetector:
         """
         self.progress_callback = progress_callback
         self.results = {}
+        # RapidFuzz threads per cdist call (-1 uses every core)
+        self.similarity_workers = -1
         
-    def analyze(self, data: pd.DataFrame, max_hours: int, similarity_threshold: int = 85) -> List[Dict]:
+    def analyze(self, data: pd.DataFrame, max_hours: int, similarity_threshold: int = 85,
+                workers: Optional[int] = None) -> List[Dict]:
         """
         Analyze data for potential duplicates within a maximum timeframe (no duplicates across windows).
         
@@ -33,36 +82,81 @@ class DuplicateDetector:
             data: DataFrame with ticket data
             max_hours: Maximum time window in hours to search for duplicates
             similarity_threshold: Minimum similarity percentage (0-100)
+            workers: Maximum number of worker processes for large inputs (defaults to the CPU count)
             
         Returns:
             List of duplicate pairs (each pair appears only once)
         """
         if data.empty:
             return []
+        
+        # Memoized scores only matter within one run
+        _score_descriptions.cache_clear()
             
         all_duplicates = []
         
-        # Group data by site
-        sites = data.groupby('Site')
-        total_sites = len(sites)
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers > 1 and len(data) >= self.PARALLEL_MIN_TICKETS:
+            # Sites are independent, so large inputs are split across worker processes
+            all_duplicates = self._analyze_parallel(data, max_hours, similarity_threshold, workers)
+        else:
+            # Split data by site, each already sorted by creation time
+            sites = self._split_sites_by_time(data)
+            total_sites = len(sites)
+            
+            for site_idx, (site_name, site_data_sorted) in enumerate(sites):
+                if self.progress_callback:
+                    self.progress_callback(f"Processing site {site_idx + 1} of {total_sites}: {site_name}", 
+                                         site_idx + 1, total_sites)
+                
+                # Find duplicates within this site
+                site_duplicates = self._find_duplicates_in_site_max_timeframe(
+                    site_data_sorted, max_hours, similarity_threshold
+                )
+                all_duplicates.extend(site_duplicates)
         
-        for site_idx, (site_name, site_data) in enumerate(sites):
-            if self.progress_callback:
-                self.progress_callback(f"Processing site {site_idx + 1} of {total_sites}: {site_name}", 
-                                     site_idx + 1, total_sites)
-            
-            # Sort by creation time for efficient comparison
-            site_data_sorted = site_data.sort_values('Created_dt').reset_index(drop=True)
+        # Sort results by similarity score (descending)
+        all_duplicates = self._sort_by_score(all_duplicates)
             
-            # Find duplicates within this site
-            site_duplicates = self._find_duplicates_in_site_max_timeframe(
-                site_data_sorted, max_hours, similarity_threshold
-            )
-            all_duplicates.extend(site_duplicates)
+        return all_duplicates
+    
+    def _analyze_parallel(self, data: pd.DataFrame, max_hours: int, similarity_threshold: int,
+                          workers: int) -> List[Dict]:
+        """
+        Run the max-timeframe search over contiguous runs of whole sites in worker processes.
         
-        # Sort results by similarity score (descending)
-        all_duplicates.sort(key=lambda x: x['similarity_score'], reverse=True)
+        Args:
+            data: DataFrame with ticket data
+            max_hours: Maximum time window in hours
+            similarity_threshold: Minimum similarity percentage
+            workers: Maximum number of worker processes
             
+        Returns:
+            Unsorted duplicate pairs, in the same order as the sequential site loop
+        """
+        data_sorted, starts, ends = self._site_bounds(data)
+        if len(starts) == 0:
+            return []
+        
+        # Cut at site boundaries into runs of roughly equal ticket counts, so each
+        # worker receives one contiguous slice instead of the whole frame
+        targets = np.linspace(0, len(data_sorted), workers + 1)[1:-1]
+        cuts = np.unique(starts[np.searchsorted(starts, targets).clip(max=len(starts) - 1)])
+        cuts = cuts[cuts > 0]
+        chunks = [data_sorted.iloc[start:end] for start, end in
+                  zip(np.concatenate(([0], cuts)), np.concatenate((cuts, [len(data_sorted)])))]
+        
+        all_duplicates = []
+        analyze_chunk = functools.partial(_analyze_site_chunk, max_hours=max_hours,
+                                          similarity_threshold=similarity_threshold)
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            for chunk_idx, chunk_duplicates in enumerate(executor.map(analyze_chunk, chunks)):
+                # Workers cannot reach the callback, so report each run of sites as it completes
+                if self.progress_callback:
+                    self.progress_callback(f"Processed site group {chunk_idx + 1} of {len(chunks)}",
+                                           chunk_idx + 1, len(chunks))
+                all_duplicates.extend(chunk_duplicates)
+        
         return all_duplicates
     
     def analyze_legacy(self, data: pd.DataFrame, time_windows: List[int], similarity_threshold: int = 85) -> Dict[int, List[Dict]]:
@@ -81,19 +175,19 @@ class DuplicateDetector:
         
         if data.empty:
             return self.results
+        
+        # Memoized scores only matter within one run
+        _score_descriptions.cache_clear()
             
-        # Group data by site
-        sites = data.groupby('Site')
+        # Split data by site, each already sorted by creation time
+        sites = self._split_sites_by_time(data)
         total_sites = len(sites)
         
-        for site_idx, (site_name, site_data) in enumerate(sites):
+        for site_idx, (site_name, site_data_sorted) in enumerate(sites):
             if self.progress_callback:
                 self.progress_callback(f"Processing site {site_idx + 1} of {total_sites}: {site_name}", 
                                      site_idx + 1, total_sites)
             
-            # Sort by creation time for efficient comparison
-            site_data_sorted = site_data.sort_values('Created_dt').reset_index(drop=True)
-            
             # Find duplicates within this site for each time window
             for time_window in time_windows:
                 site_duplicates = self._find_duplicates_in_site(
@@ -103,7 +197,7 @@ class DuplicateDetector:
         
         # Sort results by similarity score (descending)
         for time_window in self.results:
-            self.results[time_window].sort(key=lambda x: x['similarity_score'], reverse=True)
+            self.results[time_window] = self._sort_by_score(self.results[time_window])
             
         return self.results
     
@@ -133,6 +227,10 @@ class DuplicateDetector:
         if data.empty:
             return enhanced_results
         
+        # Integer-coded keys make the per-site grouping in the analyses below cheaper
+        data = data.astype({column: 'category' for column in ('Site', 'Category', 'Subcategory', 'Priority')
+                            if column in data.columns})
+        
         # Additional analysis methods
         if enable_same_day:
             enhanced_results['same_day'] = self._analyze_same_day_duplicates(data)
@@ -163,37 +261,38 @@ class DuplicateDetector:
             
         results = []
         
-        # Group by site and date
-        data['Created_date'] = data['Created_dt'].dt.date
+        # Truncate to calendar days in numpy instead of building python dates
+        dated = data.assign(Created_date=data['Created_dt'].values.astype('datetime64[D]'))
         
-        for site_name, site_data in data.groupby('Site'):
-            date_groups = site_data.groupby('Created_date')
-            
-            for date, day_tickets in date_groups:
-                if len(day_tickets) > 1:  # Multiple tickets on same day
-                    tickets = day_tickets.sort_values('Created_dt')
-                    
-                    # Calculate time span
-                    earliest_time = tickets['Created_dt'].min()
-                    latest_time = tickets['Created_dt'].max()
-                    time_span = latest_time - earliest_time
-                    
-                    # Get category mix (handle missing columns gracefully)
-                    categories = tickets['Category'].value_counts() if 'Category' in tickets.columns else pd.Series()
-                    priorities = tickets['Priority'].value_counts() if 'Priority' in tickets.columns else pd.Series()
-                    
-                    result = {
-                        'site': site_name,
-                        'date': date.strftime('%Y-%m-%d'),
-                        'ticket_count': len(tickets),
-                        'ticket_numbers': ', '.join(tickets['Number'].astype(str)),
-                        'category_mix': ', '.join([f"{cat}({count})" for cat, count in categories.items()]),
-                        'priority_mix': ', '.join([f"{pri}({count})" for pri, count in priorities.items()]),
-                        'time_span': self._format_time_difference(time_span),
-                        'earliest_time': earliest_time.strftime('%H:%M:%S'),
-                        'latest_time': latest_time.strftime('%H:%M:%S')
-                    }
-                    results.append(result)
+        # Only site/day combinations with more than one ticket need grouping
+        repeated = dated.duplicated(subset=['Site', 'Created_date'], keep=False)
+        
+        # Group by site and date
+        for (site_name, date), day_tickets in dated[repeated].groupby(['Site', 'Created_date'], observed=True):
+            if len(day_tickets) > 1:  # Multiple tickets on same day
+                tickets = day_tickets.sort_values('Created_dt')
+                
+                # Calculate time span
+                earliest_time = tickets['Created_dt'].min()
+                latest_time = tickets['Created_dt'].max()
+                time_span = latest_time - earliest_time
+                
+                # Get category mix (handle missing columns gracefully)
+                category_mix = self._value_mix(tickets['Category']) if 'Category' in tickets.columns else ''
+                priority_mix = self._value_mix(tickets['Priority']) if 'Priority' in tickets.columns else ''
+                
+                result = {
+                    'site': site_name,
+                    'date': date.strftime('%Y-%m-%d'),
+                    'ticket_count': len(tickets),
+                    'ticket_numbers': ', '.join(tickets['Number'].astype(str)),
+                    'category_mix': category_mix,
+                    'priority_mix': priority_mix,
+                    'time_span': self._format_time_difference(time_span),
+                    'earliest_time': earliest_time.strftime('%H:%M:%S'),
+                    'latest_time': latest_time.strftime('%H:%M:%S')
+                }
+                results.append(result)
         
         return sorted(results, key=lambda x: (x['site'], x['date']))
     
@@ -214,53 +313,53 @@ class DuplicateDetector:
         rapid_windows = [0.25, 0.5, 1]  # 15, 30, 60 minutes in hours
         results = []
         
-        for site_name, site_data in data.groupby('Site'):
-            site_data_sorted = site_data.sort_values('Created_dt').reset_index(drop=True)
+        for site_name, site_data_sorted in self._split_sites_by_time(data):
+            tickets = self._site_ticket_arrays(site_data_sorted)
+            times = tickets['times']
+            
+            # Score every pair once at the widest window; narrower windows reuse the matches
+            matches = []
+            window_ends = self._window_ends(times, max(rapid_windows))
+            for i, j in self._candidate_pairs(tickets, window_ends, similarity_threshold):
+                # Calculate similarity
+                similarity_score = self._calculate_lowered_similarity(
+                    tickets['description_lower'][i], 
+                    tickets['description_lower'][j],
+                    similarity_threshold
+                )
+                
+                if similarity_score >= similarity_threshold:
+                    matches.append((i, j, similarity_score))
+            
+            if not matches:
+                continue
+            
+            # Time differences of all matches as int64 nanoseconds, formatted in one pass
+            match_pairs = np.array(matches, dtype=np.int64)
+            diff_ns = times[match_pairs[:, 1]] - times[match_pairs[:, 0]]
+            formatted = self._format_time_differences(diff_ns // 1_000_000_000)
             
             for window_hours in rapid_windows:
-                window_delta = timedelta(hours=window_hours)
                 window_minutes = int(window_hours * 60)
+                in_window = np.flatnonzero(diff_ns <= pd.Timedelta(hours=window_hours).value)
                 
-                for i in range(len(site_data_sorted)):
-                    ticket1 = site_data_sorted.iloc[i]
-                    
-                    # Skip if ticket1 has invalid datetime
-                    if pd.isna(ticket1['Created_dt']):
-                        continue
-                    
-                    for j in range(i + 1, len(site_data_sorted)):
-                        ticket2 = site_data_sorted.iloc[j]
-                        
-                        # Skip if ticket2 has invalid datetime
-                        if pd.isna(ticket2['Created_dt']):
-                            continue
-                        
-                        time_diff = ticket2['Created_dt'] - ticket1['Created_dt']
-                        if time_diff > window_delta:
-                            break
-                        
-                        # Calculate similarity
-                        similarity_score = self._calculate_similarity(
-                            ticket1['Short description'], 
-                            ticket2['Short description']
-                        )
-                        
-                        if similarity_score >= similarity_threshold:
-                            result = {
-                                'site': site_name,
-                                'time_window_minutes': window_minutes,
-                                'ticket_1': ticket1['Number'],
-                                'ticket_1_description': ticket1['Short description'],
-                                'ticket_1_created': ticket1['Created'],
-                                'ticket_2': ticket2['Number'],
-                                'ticket_2_description': ticket2['Short description'],
-                                'ticket_2_created': ticket2['Created'],
-                                'time_difference': self._format_time_difference(time_diff),
-                                'similarity_score': similarity_score
-                            }
-                            results.append(result)
-        
-        return sorted(results, key=lambda x: x['similarity_score'], reverse=True)
+                for k in in_window.tolist():
+                    i, j, similarity_score = matches[k]
+                    result = {
+                        'site': site_name,
+                        'time_window_minutes': window_minutes,
+                        'ticket_1': tickets['number'][i],
+                        'ticket_1_description': tickets['description'][i],
+                        'ticket_1_created': tickets['created'][i],
+                        'ticket_2': tickets['number'][j],
+                        'ticket_2_description': tickets['description'][j],
+                        'ticket_2_created': tickets['created'][j],
+                        'time_difference': formatted[k],
+                        'similarity_score': similarity_score
+                    }
+                    results.append(result)
+        
+        return self._sort_by_score(results)
     
     def _analyze_exact_matches(self, data: pd.DataFrame) -> List[Dict]:
         """
@@ -277,35 +376,35 @@ class DuplicateDetector:
             
         results = []
         
+        # Only repeated site/description combinations need grouping
+        repeated = data.duplicated(subset=['Site', 'Short description'], keep=False) & data['Short description'].notna()
+        
         # Group by site and exact description
-        for site_name, site_data in data.groupby('Site'):
-            description_groups = site_data.groupby('Short description')
-            
-            for description, desc_tickets in description_groups:
-                if len(desc_tickets) > 1 and pd.notna(description) and str(description).strip():
-                    tickets = desc_tickets.sort_values('Created_dt')
-                    
-                    # Calculate date range
-                    earliest_date = tickets['Created_dt'].min().strftime('%Y-%m-%d %H:%M')
-                    latest_date = tickets['Created_dt'].max().strftime('%Y-%m-%d %H:%M')
-                    date_range = f"{earliest_date} to {latest_date}" if earliest_date != latest_date else earliest_date
-                    
-                    # Get category info (handle missing columns gracefully)
-                    if 'Category' in tickets.columns:
-                        categories = tickets['Category'].unique()
-                        category_info = ', '.join(categories) if len(categories) <= 3 else f"{categories[0]} (+{len(categories)-1} more)"
-                    else:
-                        category_info = 'N/A'
-                    
-                    result = {
-                        'site': site_name,
-                        'description': str(description)[:100] + '...' if len(str(description)) > 100 else str(description),
-                        'ticket_count': len(tickets),
-                        'ticket_numbers': ', '.join(tickets['Number'].astype(str)),
-                        'date_range': date_range,
-                        'category': category_info
-                    }
-                    results.append(result)
+        for (site_name, description), desc_tickets in data[repeated].groupby(['Site', 'Short description'], observed=True):
+            if len(desc_tickets) > 1 and pd.notna(description) and str(description).strip():
+                tickets = desc_tickets.sort_values('Created_dt')
+                
+                # Calculate date range
+                earliest_date = tickets['Created_dt'].min().strftime('%Y-%m-%d %H:%M')
+                latest_date = tickets['Created_dt'].max().strftime('%Y-%m-%d %H:%M')
+                date_range = f"{earliest_date} to {latest_date}" if earliest_date != latest_date else earliest_date
+                
+                # Get category info (handle missing columns gracefully)
+                if 'Category' in tickets.columns:
+                    categories = tickets['Category'].unique()
+                    category_info = ', '.join(categories) if len(categories) <= 3 else f"{categories[0]} (+{len(categories)-1} more)"
+                else:
+                    category_info = 'N/A'
+                
+                result = {
+                    'site': site_name,
+                    'description': str(description)[:100] + '...' if len(str(description)) > 100 else str(description),
+                    'ticket_count': len(tickets),
+                    'ticket_numbers': ', '.join(tickets['Number'].astype(str)),
+                    'date_range': date_range,
+                    'category': category_info
+                }
+                results.append(result)
         
         return sorted(results, key=lambda x: x['ticket_count'], reverse=True)
     
@@ -323,12 +422,11 @@ class DuplicateDetector:
             self.progress_callback("Analyzing category patterns", 4, 4)
             
         results = []
-        data['Created_date'] = data['Created_dt'].dt.date
         
         # Group by site, date, category, and subcategory (handle missing columns)
-        for site_name, site_data in data.groupby('Site'):
+        for site_name, site_data in data.groupby('Site', observed=True):
             # Only group by available columns
-            group_cols = ['Created_date']
+            group_cols = [site_data['Created_dt'].dt.date]
             if 'Category' in site_data.columns:
                 group_cols.append('Category')
             if 'Subcategory' in site_data.columns:
@@ -338,7 +436,7 @@ class DuplicateDetector:
                 # Skip if no category columns available
                 continue
                 
-            pattern_groups = site_data.groupby(group_cols)
+            pattern_groups = site_data.groupby(group_cols, observed=True)
             
             for group_key, pattern_tickets in pattern_groups:
                 # Handle different grouping scenarios
@@ -354,8 +452,7 @@ class DuplicateDetector:
                     
                     # Get priority distribution (handle missing columns gracefully)
                     if 'Priority' in tickets.columns:
-                        priorities = tickets['Priority'].value_counts()
-                        priority_dist = ', '.join([f"{pri}({count})" for pri, count in priorities.items()])
+                        priority_dist = self._value_mix(tickets['Priority'])
                     else:
                         priority_dist = 'N/A'
                     
@@ -377,94 +474,334 @@ class DuplicateDetector:
         """
         Find potential duplicates within a single site using maximum timeframe (no duplicate pairs).
         
+        Each ticket's time window is located with a binary search, and the banded
+        similarity matrix is scored in square tiles, one cdist call per tile that
+        overlaps the band.
+        
         Args:
             site_data: DataFrame containing tickets for one site, sorted by Created_dt
             max_hours: Maximum time window in hours
             similarity_threshold: Minimum similarity percentage
             
         Returns:
-            List of unique duplicate pair dictionaries
+            List of unique duplicate pair dictionaries, in (earlier, later) ticket order
         """
-        duplicates = []
-        max_time_delta = timedelta(hours=max_hours)
+        pair_i, pair_j, pair_scores = [], [], []
+        tickets = self._site_ticket_arrays(site_data)
+        if len(tickets['times']) < 2:
+            return []
         
-        # Compare each ticket with subsequent tickets within the max timeframe
-        for i in range(len(site_data)):
-            ticket1 = site_data.iloc[i]
-            
-            # Skip if ticket1 has invalid datetime
-            if pd.isna(ticket1['Created_dt']):
-                continue
+        window_ends = self._window_ends(tickets['times'], max_hours)
+        
+        has_description = np.array([desc is not None for desc in tickets['description_lower']])
+        lowered = [desc or '' for desc in tickets['description_lower']]
+        
+        # Tickets often repeat a description verbatim; tiles score each distinct text once
+        codes, distinct = pd.factorize(np.array(lowered, dtype=object))
+        
+        # Scores are rounded to whole percentages, so nothing more than half a point below
+        # the threshold can round up to it; the tighter the cutoff, the sooner RapidFuzz gives up
+        score_cutoff = max(similarity_threshold - 0.5, 0)
+        
+        tile = self.SIMILARITY_TILE_SIZE
+        for row_start in range(0, len(lowered), tile):
+            row_stop = min(row_start + tile, len(lowered))
+            col_stop = int(window_ends[row_start:row_stop].max())
             
-            # Only compare with tickets created after this one and within max timeframe
-            for j in range(i + 1, len(site_data)):
-                ticket2 = site_data.iloc[j]
+            # Walk the column tiles of this row band from the diagonal to the last window end;
+            # tiles outside the band are never scored
+            for col_start in range(row_start, col_stop, tile):
+                col_end = min(col_start + tile, col_stop)
                 
-                # Skip if ticket2 has invalid datetime
-                if pd.isna(ticket2['Created_dt']):
+                # Rows whose window ends before this tile starts have nothing in it
+                first_row = max(row_start, int(np.searchsorted(window_ends, col_start, side='right')))
+                last_row = min(row_stop, col_end - 1)
+                if first_row >= last_row:
                     continue
                 
-                # Check if ticket2 is within the max timeframe
-                time_diff = ticket2['Created_dt'] - ticket1['Created_dt']
-                if time_diff > max_time_delta:
-                    break  # No more tickets within timeframe (data is sorted)
-                
-                # Calculate similarity
-                similarity_score = self._calculate_similarity(
-                    ticket1['Short description'], 
-                    ticket2['Short description']
+                query_ids, query_pos = np.unique(codes[first_row:last_row], return_inverse=True)
+                choice_ids, choice_pos = np.unique(codes[col_start:col_end], return_inverse=True)
+                queries = distinct[query_ids]
+                choices = distinct[choice_ids]
+                distinct_scores = np.maximum(
+                    process.cdist(queries, choices, scorer=fuzz.ratio,
+                                        score_cutoff=score_cutoff, workers=self.similarity_workers),
+                    process.cdist(queries, choices, scorer=fuzz.partial_ratio,
+                                        score_cutoff=score_cutoff, workers=self.similarity_workers)
                 )
+                scores = np.rint(distinct_scores)[query_pos[:, None], choice_pos[None, :]]
                 
-                if similarity_score >= similarity_threshold:
-                    # Categorize the time difference for grouping
-                    time_category = self._categorize_time_difference(time_diff)
-                    
-                    duplicate_pair = {
-                        'site': ticket1['Site'],
-                        'ticket1_number': ticket1['Number'],
-                        'ticket1_description': ticket1['Short description'],
-                        'ticket1_created': ticket1['Created'],
-                        'ticket1_created_dt': ticket1['Created_dt'],
-                        'ticket2_number': ticket2['Number'],
-                        'ticket2_description': ticket2['Short description'],
-                        'ticket2_created': ticket2['Created'],
-                        'ticket2_created_dt': ticket2['Created_dt'],
-                        'time_difference': time_diff,
-                        'time_difference_formatted': self._format_time_difference(time_diff),
-                        'time_difference_hours': time_diff.total_seconds() / 3600,
-                        'time_category': time_category,
-                        'similarity_score': similarity_score
-                    }
-                    duplicates.append(duplicate_pair)
+                # Threshold first, then check the band only for the few surviving pairs:
+                # i < j inside i's time window, both tickets with a description
+                block_i, block_j = np.nonzero(scores >= similarity_threshold)
+                rows_i = first_row + block_i
+                rows_j = col_start + block_j
+                in_band = ((rows_j > rows_i) & (rows_j < window_ends[rows_i])
+                           & has_description[rows_i] & has_description[rows_j])
+                
+                pair_i.append(rows_i[in_band])
+                pair_j.append(rows_j[in_band])
+                pair_scores.append(scores[block_i[in_band], block_j[in_band]].astype(np.uint8))
+        
+        if not pair_i:
+            return []
         
-        return duplicates
+        # Tiles finish column by column; restore (i, j) scan order
+        pair_i = np.concatenate(pair_i)
+        pair_j = np.concatenate(pair_j)
+        order = np.lexsort((pair_j, pair_i))
+        return self._build_pair_records(tickets, pair_i[order], pair_j[order],
+                                        np.concatenate(pair_scores)[order])
     
-    def _categorize_time_difference(self, time_diff: timedelta) -> str:
+    @staticmethod
+    def _value_mix(values: pd.Series) -> str:
         """
-        Categorize time difference for easy grouping and analysis.
+        Summarize a column as "value(count)" entries, most frequent first.
+        
+        Matches value_counts() ordering (ties keep first appearance) but skips the
+        zero counts a categorical column would report for values absent from the group.
         
         Args:
-            time_diff: Time difference as timedelta
+            values: Column values of one group of tickets
             
         Returns:
-            Category string for grouping
-        """
-        hours = time_diff.total_seconds() / 3600
-        
-        if hours <= 1:
-            return "0-1h"
-        elif hours <= 4:
-            return "1-4h"
-        elif hours <= 8:
-            return "4-8h"
-        elif hours <= 24:
-            return "8-24h"
-        elif hours <= 72:
-            return "1-3d"
-        elif hours <= 168:
-            return "3-7d"
-        else:
-            return ">7d"
+            Comma-separated "value(count)" string
+        """
+        counts = Counter(value for value in values.tolist() if pd.notna(value))
+        return ', '.join(f"{value}({count})" for value, count in counts.most_common())
+    
+    @staticmethod
+    def _sort_by_score(duplicates: List[Dict]) -> List[Dict]:
+        """
+        Order duplicate records by similarity score, highest first.
+        
+        Scores fit in a byte, so they are ranked with a native stable sort over a
+        uint8 array instead of a Python key function; equal scores keep scan order.
+        
+        Args:
+            duplicates: Records with a 'similarity_score' between 0 and 100
+            
+        Returns:
+            New list of the same records, sorted
+        """
+        scores = np.fromiter((dup['similarity_score'] for dup in duplicates), dtype=np.uint8, count=len(duplicates))
+        return [duplicates[k] for k in np.argsort(100 - scores, kind='stable').tolist()]
+    
+    @staticmethod
+    def _split_sites_by_time(data: pd.DataFrame) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        Split tickets into per-site slices sorted by creation time, using one global sort.
+        
+        Args:
+            data: DataFrame with ticket data
+            
+        Returns:
+            List of (site_name, site_data) in the same site order as groupby('Site')
+        """
+        data_sorted, starts, ends = DuplicateDetector._site_bounds(data)
+        return [(data_sorted['Site'].iat[start], data_sorted.iloc[start:end])
+                for start, end in zip(starts, ends)]
+    
+    @staticmethod
+    def _site_bounds(data: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+        """
+        Sort tickets by site and creation time and locate each site's contiguous rows.
+        
+        Args:
+            data: DataFrame with ticket data
+            
+        Returns:
+            Tuple of (sorted data without missing sites, site start positions, site end positions)
+        """
+        data_sorted = data[data['Site'].notna()].sort_values(['Site', 'Created_dt']).reset_index(drop=True)
+        if data_sorted.empty:
+            return data_sorted, np.array([], dtype=np.intp), np.array([], dtype=np.intp)
+        
+        # Sites are contiguous after the sort; slice at every change of site code
+        site_codes, _ = pd.factorize(data_sorted['Site'])
+        boundaries = np.flatnonzero(np.diff(site_codes)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(data_sorted)]))
+        return data_sorted, starts, ends
+    
+    @staticmethod
+    def _site_ticket_arrays(site_data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Extract the columns used for pair matching as arrays, dropping tickets without a creation time.
+        
+        Args:
+            site_data: DataFrame containing tickets for one site, sorted by Created_dt
+            
+        Returns:
+            Dictionary of equally long arrays; 'times' holds creation times as int64 nanoseconds
+            and 'description_lower' the interned lowercase descriptions (None when missing)
+        """
+        site_data = site_data[site_data['Created_dt'].notna()]
+        descriptions = site_data['Short description'].to_numpy()
+        return {
+            'times': DuplicateDetector._created_ns(site_data),
+            'created_dt': site_data['Created_dt'].array,
+            'site': site_data['Site'].to_numpy(),
+            'number': site_data['Number'].to_numpy(),
+            'description': descriptions,
+            'description_lower': [sys.intern(str(desc).lower()) if pd.notna(desc) else None
+                                  for desc in descriptions],
+            'created': site_data['Created'].to_numpy()
+        }
+    
+    @staticmethod
+    def _created_ns(data: pd.DataFrame) -> np.ndarray:
+        """
+        Get creation times as int64 nanoseconds, reusing the parser's Created_ns column when present.
+        
+        Args:
+            data: DataFrame with ticket data
+            
+        Returns:
+            int64 array aligned with the rows of data
+        """
+        if 'Created_ns' in data.columns:
+            return data['Created_ns'].to_numpy(dtype=np.int64)
+        return data['Created_dt'].to_numpy(dtype='datetime64[ns]').view('i8')
+    
+    @staticmethod
+    def _window_ends(times: np.ndarray, hours: float) -> np.ndarray:
+        """
+        Find, for each ticket, the end (exclusive) of the tickets created within the window after it.
+        
+        Args:
+            times: Sorted creation times as int64 nanoseconds
+            hours: Window length in hours
+            
+        Returns:
+            Array of exclusive end positions, one per ticket
+        """
+        return np.searchsorted(times, times + pd.Timedelta(hours=hours).value, side='right')
+    
+    def _candidate_pairs(self, tickets: Dict[str, np.ndarray], window_ends: np.ndarray,
+                         similarity_threshold: int):
+        """
+        Generate the (i, j) band pairs that can still reach the similarity threshold.
+        
+        Pairs are pruned with character-histogram bounds that hold for both ratio and
+        partial_ratio, so no pair scoring at or above the threshold is ever dropped.
+        
+        Args:
+            tickets: Column arrays from _site_ticket_arrays
+            window_ends: Exclusive window end of each ticket from _window_ends
+            similarity_threshold: Minimum similarity percentage
+            
+        Yields:
+            (i, j) position pairs with i < j inside i's time window, in scan order
+        """
+        lowered = [desc or '' for desc in tickets['description_lower']]
+        has_description = np.array([desc is not None for desc in tickets['description_lower']], dtype=bool)
+        n = len(lowered)
+        if n < 2:
+            return
+        
+        # Bucketed character counts per description; merging characters into buckets
+        # only loosens the bounds, so the pruning stays safe
+        buckets = self.FINGERPRINT_BUCKETS
+        lengths = np.fromiter(map(len, lowered), dtype=np.int64, count=n)
+        codepoints = np.frombuffer(''.join(lowered).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        rows = np.repeat(np.arange(n), lengths)
+        histograms = np.bincount(rows * buckets + codepoints % buckets, minlength=n * buckets)
+        histograms = histograms.reshape(n, buckets).astype(np.int32)
+        
+        # Rounded scores reach the threshold from half a point below it
+        cutoff = (similarity_threshold - 0.5) / 100
+        
+        # Flatten the band into pair batches of bounded size
+        counts = window_ends - np.arange(n) - 1
+        batch_ends = np.searchsorted(np.cumsum(counts), np.arange(1, counts.sum() // self.FINGERPRINT_PAIR_BATCH + 1)
+                                     * self.FINGERPRINT_PAIR_BATCH)
+        for row_start, row_stop in zip(np.concatenate(([0], batch_ends + 1)), np.concatenate((batch_ends + 1, [n]))):
+            row_counts = counts[row_start:row_stop]
+            pair_i = np.repeat(np.arange(row_start, row_stop), row_counts)
+            if len(pair_i) == 0:
+                continue
+            pair_j = pair_i + 1 + np.arange(len(pair_i)) - np.repeat(np.cumsum(row_counts) - row_counts, row_counts)
+            keep = has_description[pair_i] & has_description[pair_j]
+            
+            diff = histograms[pair_i] - histograms[pair_j]
+            surplus_i = np.clip(diff, 0, None).sum(axis=1)   # characters of i missing from j
+            surplus_j = np.clip(-diff, 0, None).sum(axis=1)  # characters of j missing from i
+            len_i, len_j = lengths[pair_i], lengths[pair_j]
+            
+            # ratio <= 1 - (surplus_i + surplus_j) / (len_i + len_j)
+            ratio_ok = surplus_i + surplus_j <= (1 - cutoff) * (len_i + len_j) + 1e-9
+            # partial_ratio of shorter s against any substring of the other string
+            # is at most 2(m - E) / (2m - E), with m = len(s) and E = s's surplus
+            partial_i = (len_i <= len_j) & (surplus_i * (2 - cutoff) <= 2 * (1 - cutoff) * len_i + 1e-9)
+            partial_j = (len_j <= len_i) & (surplus_j * (2 - cutoff) <= 2 * (1 - cutoff) * len_j + 1e-9)
+            keep &= ratio_ok | partial_i | partial_j
+            
+            yield from zip(pair_i[keep].tolist(), pair_j[keep].tolist())
+    
+    def _build_pair_records(self, tickets: Dict[str, np.ndarray], pair_i, pair_j, scores,
+                            time_window_hours: Optional[int] = None) -> List[Dict]:
+        """
+        Build the duplicate pair dictionaries for all matched pairs of a site at once.
+        
+        Time differences are taken from the int64 nanosecond times, so hours, categories
+        and formatted strings are computed for the whole site without per-pair timedelta math.
+        
+        Args:
+            tickets: Column arrays from _site_ticket_arrays
+            pair_i: Positions of the earlier ticket of each pair
+            pair_j: Positions of the later ticket of each pair
+            scores: Similarity score of each pair
+            time_window_hours: Legacy time window; when given, records use the legacy layout
+                (no hours/category fields, tagged with the window instead)
+            
+        Returns:
+            List of duplicate pair dictionaries, one per (i, j) pair
+        """
+        pair_i = np.asarray(pair_i, dtype=np.intp)
+        pair_j = np.asarray(pair_j, dtype=np.intp)
+        
+        # Gather every field as one column, then zip the columns into records
+        created_dt = tickets['created_dt']
+        time_diffs = created_dt[pair_j] - created_dt[pair_i]
+        time_diff_ns = tickets['times'][pair_j] - tickets['times'][pair_i]
+        time_diff_hours = time_diff_ns / 1e9 / 3600
+        columns = {
+            # One site per call: every record shares a single site string object
+            'site': tickets['site'][pair_i[:1]].tolist() * len(pair_i),
+            'ticket1_number': tickets['number'][pair_i],
+            'ticket1_description': tickets['description'][pair_i],
+            'ticket1_created': tickets['created'][pair_i],
+            'ticket1_created_dt': created_dt[pair_i],
+            'ticket2_number': tickets['number'][pair_j],
+            'ticket2_description': tickets['description'][pair_j],
+            'ticket2_created': tickets['created'][pair_j],
+            'ticket2_created_dt': created_dt[pair_j],
+            'time_difference': time_diffs,
+            'time_difference_formatted': self._format_time_differences(time_diff_ns // 1_000_000_000),
+            'time_difference_hours': time_diff_hours.tolist(),
+            'time_category': self._categorize_time_differences(time_diff_hours),
+            'similarity_score': np.asarray(scores, dtype=np.uint8).tolist()
+        }
+        if time_window_hours is not None:
+            del columns['time_difference_hours'], columns['time_category']
+            columns['time_window_hours'] = [time_window_hours] * len(pair_i)
+        
+        keys = list(columns)
+        return [dict(zip(keys, values)) for values in zip(*columns.values())]
+    
+    def _categorize_time_differences(self, hours: np.ndarray) -> List[str]:
+        """
+        Categorize time differences for easy grouping and analysis: 0-1h, 1-4h,
+        4-8h, 8-24h, 1-3d, 3-7d or >7d, each bucket including its upper bound.
+        
+        Args:
+            hours: Time differences in hours
+            
+        Returns:
+            Category string for each time difference
+        """
+        return self.TIME_CATEGORY_LABELS[np.digitize(hours, self.TIME_CATEGORY_BOUNDS, right=True)].tolist()
     
     def _find_duplicates_in_site(self, site_data: pd.DataFrame, time_window_hours: int, 
                                  similarity_threshold: int) -> List[Dict]:
@@ -479,63 +816,34 @@ class DuplicateDetector:
         Returns:
             List of duplicate pair dictionaries
         """
-        duplicates = []
-        time_window_delta = timedelta(hours=time_window_hours)
-        
-        # Compare each ticket with subsequent tickets within the time window
-        for i in range(len(site_data)):
-            ticket1 = site_data.iloc[i]
-            
-            # Skip if ticket1 has invalid datetime
-            if pd.isna(ticket1['Created_dt']):
-                continue
+        pair_i, pair_j, pair_scores = [], [], []
+        tickets = self._site_ticket_arrays(site_data)
+        window_ends = self._window_ends(tickets['times'], time_window_hours)
+        
+        # Compare each ticket only with the later tickets inside its time window
+        for i, j in self._candidate_pairs(tickets, window_ends, similarity_threshold):
+            # Calculate similarity
+            similarity_score = self._calculate_lowered_similarity(
+                tickets['description_lower'][i], 
+                tickets['description_lower'][j],
+                similarity_threshold
+            )
             
-            # Only compare with tickets created after this one and within time window
-            for j in range(i + 1, len(site_data)):
-                ticket2 = site_data.iloc[j]
-                
-                # Skip if ticket2 has invalid datetime
-                if pd.isna(ticket2['Created_dt']):
-                    continue
-                
-                # Check if ticket2 is within the time window
-                time_diff = ticket2['Created_dt'] - ticket1['Created_dt']
-                if time_diff > time_window_delta:
-                    break  # No more tickets within time window (data is sorted)
-                
-                # Calculate similarity
-                similarity_score = self._calculate_similarity(
-                    ticket1['Short description'], 
-                    ticket2['Short description']
-                )
-                
-                if similarity_score >= similarity_threshold:
-                    duplicate_pair = {
-                        'site': ticket1['Site'],
-                        'ticket1_number': ticket1['Number'],
-                        'ticket1_description': ticket1['Short description'],
-                        'ticket1_created': ticket1['Created'],
-                        'ticket1_created_dt': ticket1['Created_dt'],
-                        'ticket2_number': ticket2['Number'],
-                        'ticket2_description': ticket2['Short description'],
-                        'ticket2_created': ticket2['Created'],
-                        'ticket2_created_dt': ticket2['Created_dt'],
-                        'time_difference': time_diff,
-                        'time_difference_formatted': self._format_time_difference(time_diff),
-                        'similarity_score': similarity_score,
-                        'time_window_hours': time_window_hours
-                    }
-                    duplicates.append(duplicate_pair)
+            if similarity_score >= similarity_threshold:
+                pair_i.append(i)
+                pair_j.append(j)
+                pair_scores.append(similarity_score)
         
-        return duplicates
+        return self._build_pair_records(tickets, pair_i, pair_j, pair_scores, time_window_hours)
     
-    def _calculate_similarity(self, desc1: str, desc2: str) -> int:
+    def _calculate_similarity(self, desc1: str, desc2: str, score_cutoff: int = 0) -> int:
         """
         Calculate similarity between two descriptions using fuzzy string matching.
         
         Args:
             desc1: First description
             desc2: Second description
+            score_cutoff: Scores below this may be reported as 0, letting the scorers stop early
             
         Returns:
             Similarity score (0-100)
@@ -543,23 +851,29 @@ class DuplicateDetector:
         if pd.isna(desc1) or pd.isna(desc2):
             return 0
         
-        if HAS_FUZZYWUZZY:
-            # Use fuzz.ratio for overall similarity, but also consider partial matches
-            ratio_score = fuzz.ratio(str(desc1).lower(), str(desc2).lower())
-            partial_score = fuzz.partial_ratio(str(desc1).lower(), str(desc2).lower())
-            
-            # Take the higher of the two scores to catch both exact and partial matches
-            return max(ratio_score, partial_score)
-        else:
-            # Fallback to difflib
-            desc1_clean = str(desc1).lower().strip()
-            desc2_clean = str(desc2).lower().strip()
-            
-            if not desc1_clean or not desc2_clean:
-                return 0
+        return self._calculate_lowered_similarity(str(desc1).lower(), str(desc2).lower(), score_cutoff)
+    
+    def _calculate_lowered_similarity(self, desc1_lower: Optional[str], desc2_lower: Optional[str],
+                                      score_cutoff: int = 0) -> int:
+        """
+        Calculate similarity between two already lowercased descriptions.
+        
+        Args:
+            desc1_lower: First description in lowercase, or None when missing
+            desc2_lower: Second description in lowercase, or None when missing
+            score_cutoff: Scores below this may be reported as 0, letting the scorers stop early
             
-            similarity = difflib.SequenceMatcher(None, desc1_clean, desc2_clean).ratio()
-            return int(similarity * 100)
+        Returns:
+            Similarity score (0-100)
+        """
+        if desc1_lower is None or desc2_lower is None:
+            return 0
+        
+        if desc2_lower < desc1_lower:
+            # Both scores are symmetric, so both orders share one cache entry
+            desc1_lower, desc2_lower = desc2_lower, desc1_lower
+        
+        return _score_descriptions(desc1_lower, desc2_lower, score_cutoff)
     
     def _format_time_difference(self, time_diff: timedelta) -> str:
         """
@@ -578,6 +892,20 @@ class DuplicateDetector:
         
         return f"{hours}:{minutes:02d}:{seconds:02d}"
     
+    def _format_time_differences(self, total_seconds: np.ndarray) -> List[str]:
+        """
+        Vectorized form of _format_time_difference.
+        
+        Args:
+            total_seconds: Whole-second time differences as integers
+            
+        Returns:
+            Formatted string for each time difference (e.g., "2:30:15")
+        """
+        hours, remainder = np.divmod(total_seconds, 3600)
+        minutes, seconds = np.divmod(remainder, 60)
+        return [f"{h}:{m:02d}:{sec:02d}" for h, m, sec in zip(hours.tolist(), minutes.tolist(), seconds.tolist())]
+    
     def get_summary_stats(self) -> Dict[int, Dict]:
         """
         Get summary statistics for each time window.
@@ -588,19 +916,16 @@ class DuplicateDetector:
         stats = {}
         
         for time_window, duplicates in self.results.items():
-            unique_sites = set()
-            unique_tickets = set()
-            
-            for dup in duplicates:
-                unique_sites.add(dup['site'])
-                unique_tickets.add(dup['ticket1_number'])
-                unique_tickets.add(dup['ticket2_number'])
+            sites = [dup['site'] for dup in duplicates]
+            tickets = [dup['ticket1_number'] for dup in duplicates] + [dup['ticket2_number'] for dup in duplicates]
+            scores = np.fromiter((dup['similarity_score'] for dup in duplicates), dtype=np.int64, count=len(duplicates))
             
+            # Distinct counts and the mean are hash/reduction kernels over whole columns
             stats[time_window] = {
                 'total_pairs': len(duplicates),
-                'affected_sites': len(unique_sites),
-                'unique_tickets_involved': len(unique_tickets),
-                'avg_similarity': sum(dup['similarity_score'] for dup in duplicates) / len(duplicates) if duplicates else 0
+                'affected_sites': len(pd.unique(pd.Series(sites, dtype=object))),
+                'unique_tickets_involved': len(pd.unique(pd.Series(tickets, dtype=object))),
+                'avg_similarity': float(scores.mean()) if duplicates else 0
             }
         
         return stats
@@ -618,24 +943,19 @@ class DuplicateDetector:
         if duplicates is None:
             duplicates = getattr(self, 'current_results', [])
         
-        all_results = []
-        
-        for duplicate in duplicates:
-            all_results.append({
-                'Site': duplicate['site'],
-                'Ticket_1_Number': duplicate['ticket1_number'],
-                'Ticket_1_Description': duplicate['ticket1_description'],
-                'Ticket_1_Created': duplicate['ticket1_created'],
-                'Ticket_2_Number': duplicate['ticket2_number'],
-                'Ticket_2_Description': duplicate['ticket2_description'],
-                'Ticket_2_Created': duplicate['ticket2_created'],
-                'Time_Difference': duplicate['time_difference_formatted'],
-                'Time_Difference_Hours': duplicate['time_difference_hours'],
-                'Time_Category': duplicate['time_category'],
-                'Similarity_Score': duplicate['similarity_score']
-            })
-        
-        return pd.DataFrame(all_results)
+        return self._records_to_frame(duplicates, {
+            'Site': 'site',
+            'Ticket_1_Number': 'ticket1_number',
+            'Ticket_1_Description': 'ticket1_description',
+            'Ticket_1_Created': 'ticket1_created',
+            'Ticket_2_Number': 'ticket2_number',
+            'Ticket_2_Description': 'ticket2_description',
+            'Ticket_2_Created': 'ticket2_created',
+            'Time_Difference': 'time_difference_formatted',
+            'Time_Difference_Hours': 'time_difference_hours',
+            'Time_Category': 'time_category',
+            'Similarity_Score': 'similarity_score'
+        })
     
     def export_results(self, time_windows: List[int] = None) -> pd.DataFrame:
         """
@@ -647,23 +967,37 @@ class DuplicateDetector:
         Returns:
             DataFrame with all duplicate pairs
         """
-        all_results = []
-        
         windows_to_export = time_windows if time_windows is not None else list(self.results.keys())
+        duplicates = [duplicate for time_window in windows_to_export for duplicate in self.results[time_window]]
+        
+        return self._records_to_frame(duplicates, {
+            'Time_Window_Hours': 'time_window_hours',
+            'Site': 'site',
+            'Ticket_1_Number': 'ticket1_number',
+            'Ticket_1_Description': 'ticket1_description',
+            'Ticket_1_Created': 'ticket1_created',
+            'Ticket_2_Number': 'ticket2_number',
+            'Ticket_2_Description': 'ticket2_description',
+            'Ticket_2_Created': 'ticket2_created',
+            'Time_Difference': 'time_difference_formatted',
+            'Similarity_Score': 'similarity_score'
+        })
+    
+    @staticmethod
+    def _records_to_frame(duplicates: List[Dict], fields: Dict[str, str]) -> pd.DataFrame:
+        """
+        Build an export DataFrame column by column from duplicate records.
+        
+        Args:
+            duplicates: Duplicate pair dictionaries
+            fields: Export column name for each record key, in column order
+            
+        Returns:
+            DataFrame with one row per record (no columns when there are no records)
+        """
+        if not duplicates:
+            return pd.DataFrame()
         
-        for time_window in windows_to_export:
-            for duplicate in self.results[time_window]:
-                all_results.append({
-                    'Time_Window_Hours': duplicate['time_window_hours'],
-                    'Site': duplicate['site'],
-                    'Ticket_1_Number': duplicate['ticket1_number'],
-                    'Ticket_1_Description': duplicate['ticket1_description'],
-                    'Ticket_1_Created': duplicate['ticket1_created'],
-                    'Ticket_2_Number': duplicate['ticket2_number'],
-                    'Ticket_2_Description': duplicate['ticket2_description'],
-                    'Ticket_2_Created': duplicate['ticket2_created'],
-                    'Time_Difference': duplicate['time_difference_formatted'],
-                    'Similarity_Score': duplicate['similarity_score']
-                })
-        
-        return pd.DataFrame(all_results)
\ No newline at end of file
+        # One list per column avoids inferring columns row by row from dicts
+        return pd.DataFrame({column: [duplicate[key] for duplicate in duplicates]
+                             for column, key in fields.items()})
\ No newline at end of file
@@ -1,160 +1,258 @@
+import numpy as np
 import pandas as pd
-from datetime import timedelta
 from typing import List, Dict, Tuple, Callable
-import difflib
+from rapidfuzz import fuzz, process
 
 class SimpleDuplicateDetector:
-    """Simple duplicate detector using Python's built-in difflib for string similarity."""
+    """Simple duplicate detector using a plain RapidFuzz ratio for string similarity."""
+    
+    # Working column holding the lowercased, stripped descriptions
+    CLEAN_DESCRIPTION = '_description_clean'
+    
+    # Character histogram buckets and pairs compared per batch in the blocking prefilter
+    CHARACTER_BUCKETS = 128
+    BLOCK_BATCH = 16_384
     
     def __init__(self, progress_callback: Callable[[str, int, int], None] = None):
         self.progress_callback = progress_callback
         self.results = {}
+        self.pair_columns = {}  # Same pairs as results, one list per field for each time window
+        # RapidFuzz threads per cpdist call (-1 uses every core)
+        self.similarity_workers = -1
         
     def analyze(self, data: pd.DataFrame, time_windows: List[int], similarity_threshold: int = 85) -> Dict[int, List[Dict]]:
         """
-        Analyze data for potential duplicates using built-in string similarity.
+        Analyze data for potential duplicates using plain string similarity.
         """
         self.results = {window: [] for window in time_windows}
+        self.pair_columns = {window: {} for window in time_windows}
         
         if data.empty:
             return self.results
+        
+        # Normalize every description once up front rather than per site or per pair
+        data = data.assign(**{self.CLEAN_DESCRIPTION: [
+            str(desc).lower().strip() if pd.notna(desc) else '' for desc in data['Short description'].tolist()
+        ]})
             
-        # Group data by site
-        sites = data.groupby('Site')
-        total_sites = len(sites)
+        # One sort by site then creation time leaves every site as a contiguous, time-ordered slice
+        data_sorted = data[data['Site'].notna()].sort_values(['Site', 'Created_dt']).reset_index(drop=True)
+        site_codes, _ = pd.factorize(data_sorted['Site'])
+        boundaries = np.flatnonzero(np.diff(site_codes)) + 1
+        starts = np.concatenate(([0], boundaries)) if len(data_sorted) else boundaries
+        ends = np.concatenate((boundaries, [len(data_sorted)])) if len(data_sorted) else boundaries
+        total_sites = len(starts)
         
-        for site_idx, (site_name, site_data) in enumerate(sites):
+        for site_idx, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+            site_name = data_sorted['Site'].iat[start]
             if self.progress_callback:
                 self.progress_callback(f"Processing site {site_idx + 1} of {total_sites}: {site_name}", 
                                      site_idx + 1, total_sites)
             
-            # Sort by creation time for efficient comparison
-            site_data_sorted = site_data.sort_values('Created_dt').reset_index(drop=True)
+            site_data_sorted = data_sorted.iloc[start:end]
             
             # Find duplicates within this site for each time window
-            for time_window in time_windows:
-                site_duplicates = self._find_duplicates_in_site(
-                    site_data_sorted, time_window, similarity_threshold
-                )
-                self.results[time_window].extend(site_duplicates)
-        
-        # Sort results by similarity score (descending)
-        for time_window in self.results:
-            self.results[time_window].sort(key=lambda x: x['similarity_score'], reverse=True)
+            site_duplicates = self._find_duplicates_in_site(
+                site_data_sorted, time_windows, similarity_threshold
+            )
+            for time_window, columns in zip(time_windows, site_duplicates):
+                window_columns = self.pair_columns[time_window]
+                for field, values in columns.items():
+                    window_columns.setdefault(field, []).extend(values)
+        
+        for time_window, columns in self.pair_columns.items():
+            if not columns:
+                continue
+            
+            # Sort results by similarity score (descending); a stable native sort over the
+            # byte-sized scores keeps equal scores in scan order, like list.sort(reverse=True)
+            scores = np.asarray(columns['similarity_score'], dtype=np.uint8)
+            order = np.argsort(100 - scores, kind='stable').tolist()
+            for field, values in columns.items():
+                columns[field] = [values[k] for k in order]
+            
+            keys = list(columns)
+            self.results[time_window] = [dict(zip(keys, values)) for values in zip(*columns.values())]
             
         return self.results
     
-    def _find_duplicates_in_site(self, site_data: pd.DataFrame, time_window_hours: int, 
-                                 similarity_threshold: int) -> List[Dict]:
-        """Find potential duplicates within a single site for a specific time window."""
-        duplicates = []
-        time_window_delta = timedelta(hours=time_window_hours)
-        
-        # Compare each ticket with subsequent tickets within the time window
-        for i in range(len(site_data)):
-            ticket1 = site_data.iloc[i]
-            
-            # Only compare with tickets created after this one and within time window
-            for j in range(i + 1, len(site_data)):
-                ticket2 = site_data.iloc[j]
-                
-                # Check if ticket2 is within the time window
-                time_diff = ticket2['Created_dt'] - ticket1['Created_dt']
-                if time_diff > time_window_delta:
-                    break  # No more tickets within time window (data is sorted)
-                
-                # Calculate similarity
-                similarity_score = self._calculate_similarity(
-                    ticket1['Short description'], 
-                    ticket2['Short description']
-                )
-                
-                if similarity_score >= similarity_threshold:
-                    duplicate_pair = {
-                        'site': ticket1['Site'],
-                        'ticket1_number': ticket1['Number'],
-                        'ticket1_description': ticket1['Short description'],
-                        'ticket1_created': ticket1['Created'],
-                        'ticket1_created_dt': ticket1['Created_dt'],
-                        'ticket2_number': ticket2['Number'],
-                        'ticket2_description': ticket2['Short description'],
-                        'ticket2_created': ticket2['Created'],
-                        'ticket2_created_dt': ticket2['Created_dt'],
-                        'time_difference': time_diff,
-                        'time_difference_formatted': self._format_time_difference(time_diff),
-                        'similarity_score': similarity_score,
-                        'time_window_hours': time_window_hours
-                    }
-                    duplicates.append(duplicate_pair)
-        
-        return duplicates
+    def _find_duplicates_in_site(self, site_data: pd.DataFrame, time_windows: List[int], 
+                                 similarity_threshold: int) -> List[Dict[str, list]]:
+        """
+        Find potential duplicates within a single site for each time window.
+        
+        Pairs are scored once for the widest window; narrower windows reuse those scores.
+        Each window's pairs come back as columns (one list per duplicate pair field).
+        """
+        if not time_windows:
+            return []
+        
+        columns = self._site_columns(site_data)
+        times = columns['times']
+        widest_ns = pd.Timedelta(hours=max(time_windows)).value
+        
+        # Data is sorted, so each ticket's window ends where the first later ticket falls outside it
+        window_ends = np.searchsorted(times, times + widest_ns, side='right')
+        pair_i, pair_j = self._window_pairs(window_ends)
+        
+        # Only compare with tickets created after this one and within the widest window
+        scores = self._score_pairs(columns['cleaned'], pair_i, pair_j, similarity_threshold)
+        matched = scores >= similarity_threshold
+        pair_i, pair_j, scores = pair_i[matched], pair_j[matched], scores[matched]
+        time_diff_ns = times[pair_j] - times[pair_i]
+        
+        site_duplicates = []
+        for time_window_hours in time_windows:
+            in_window = time_diff_ns <= pd.Timedelta(hours=time_window_hours).value
+            site_duplicates.append(self._pair_columns(columns, pair_i[in_window], pair_j[in_window],
+                                                      time_diff_ns[in_window], scores[in_window],
+                                                      time_window_hours))
+        
+        return site_duplicates
+    
+    def _site_columns(self, site_data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Pull a site's columns out as arrays once; per-row .iloc builds a Series for every ticket."""
+        # Tickets without a creation time or a description can never be paired, so they are
+        # dropped here once instead of being guarded against in every comparison
+        site_data = site_data[site_data['Created_dt'].notna() & site_data[self.CLEAN_DESCRIPTION].ne('')]
+        return {
+            # int64 nanoseconds; the parser's Created_ns column saves converting Created_dt again
+            'times': (site_data['Created_ns'].to_numpy(dtype=np.int64) if 'Created_ns' in site_data.columns
+                      else site_data['Created_dt'].to_numpy(dtype='datetime64[ns]').view('i8')),
+            'created_dt': site_data['Created_dt'].array,
+            'site': site_data['Site'].to_numpy(),
+            'number': site_data['Number'].to_numpy(),
+            'description': site_data['Short description'].to_numpy(),
+            'cleaned': site_data[self.CLEAN_DESCRIPTION].to_numpy(dtype=object),
+            'created': site_data['Created'].to_numpy()
+        }
+    
+    def _pair_columns(self, columns: Dict[str, np.ndarray], pair_i: np.ndarray, pair_j: np.ndarray,
+                      time_diff_ns: np.ndarray, scores: np.ndarray, time_window_hours: int) -> Dict[str, list]:
+        """Gather the duplicate pair fields for matched (i, j) positions of one site, one list per field."""
+        created_dt = columns['created_dt']
+        time_diffs = list(created_dt[pair_j] - created_dt[pair_i])
+        fields = {
+            'site': columns['site'][pair_i[:1]].tolist() * len(pair_i),  # One shared object per site
+            'ticket1_number': columns['number'][pair_i].tolist(),
+            'ticket1_description': columns['description'][pair_i].tolist(),
+            'ticket1_created': columns['created'][pair_i].tolist(),
+            'ticket1_created_dt': list(created_dt[pair_i]),
+            'ticket2_number': columns['number'][pair_j].tolist(),
+            'ticket2_description': columns['description'][pair_j].tolist(),
+            'ticket2_created': columns['created'][pair_j].tolist(),
+            'ticket2_created_dt': list(created_dt[pair_j]),
+            'time_difference': time_diffs,
+            'time_difference_formatted': self._format_time_differences(time_diff_ns // 1_000_000_000),
+            'similarity_score': scores.tolist(),
+            'time_window_hours': [time_window_hours] * len(pair_i)
+        }
+        return fields
     
-    def _calculate_similarity(self, desc1: str, desc2: str) -> int:
-        """Calculate similarity using Python's difflib."""
-        if pd.isna(desc1) or pd.isna(desc2):
-            return 0
+    @staticmethod
+    def _window_pairs(window_ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Expand per-ticket window ends into (i, j) pairs with i < j < window_ends[i], in scan order."""
+        counts = window_ends - np.arange(len(window_ends)) - 1
+        pair_i = np.repeat(np.arange(len(window_ends)), counts)
         
-        desc1_clean = str(desc1).lower().strip()
-        desc2_clean = str(desc2).lower().strip()
+        # j runs from i + 1 within each ticket's run of pairs
+        run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        pair_j = pair_i + 1 + np.arange(len(pair_i)) - run_starts
+        return pair_i, pair_j
+    
+    def _score_pairs(self, cleaned: np.ndarray, pair_i: np.ndarray, pair_j: np.ndarray,
+                     similarity_threshold: int) -> np.ndarray:
+        """Score pairs of normalized, non-blank descriptions with RapidFuzz."""
+        scores = np.zeros(len(pair_i), dtype=np.int64)
         
-        if not desc1_clean or not desc2_clean:
-            return 0
+        # ratio is at most 2 * min(len) / (len_i + len_j), so pairs of very different
+        # lengths can be rejected without scoring them
+        lengths = np.fromiter(map(len, cleaned), dtype=np.int64, count=len(cleaned))
+        len_i, len_j = lengths[pair_i], lengths[pair_j]
+        candidates = np.flatnonzero(200 * np.minimum(len_i, len_j) >= similarity_threshold * (len_i + len_j))
+        candidates = self._block_by_characters(cleaned, lengths, pair_i, pair_j, candidates, similarity_threshold)
+        if len(candidates) == 0:
+            return scores
         
-        # Use difflib.SequenceMatcher for similarity ratio
-        similarity = difflib.SequenceMatcher(None, desc1_clean, desc2_clean).ratio()
+        # Scores below the cutoff come back as 0, letting the scorer stop early
+        ratios = process.cpdist(cleaned[pair_i[candidates]], cleaned[pair_j[candidates]], scorer=fuzz.ratio,
+                                score_cutoff=similarity_threshold, dtype=np.float64,
+                                workers=self.similarity_workers)
+        scores[candidates] = np.floor(ratios).astype(np.int64)
         
-        return int(similarity * 100)
+        return scores
     
-    def _format_time_difference(self, time_diff: timedelta) -> str:
-        """Format time difference as H:M:S string."""
-        total_seconds = int(time_diff.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        
-        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    def _block_by_characters(self, cleaned: np.ndarray, lengths: np.ndarray, pair_i: np.ndarray,
+                             pair_j: np.ndarray, candidates: np.ndarray, similarity_threshold: int) -> np.ndarray:
+        """Keep the candidate pairs whose shared characters still allow the similarity threshold."""
+        if len(candidates) == 0:
+            return candidates
+        
+        # Bucketed character counts per description; merging characters into
+        # buckets only loosens the bound, so no real match is ever dropped
+        buckets = self.CHARACTER_BUCKETS
+        codepoints = np.frombuffer(''.join(cleaned).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        rows = np.repeat(np.arange(len(cleaned)), lengths)
+        histograms = np.bincount(rows * buckets + codepoints % buckets, minlength=len(cleaned) * buckets)
+        histograms = histograms.reshape(len(cleaned), buckets).astype(np.int32)
+        
+        keep = []
+        for start in range(0, len(candidates), self.BLOCK_BATCH):
+            batch = candidates[start:start + self.BLOCK_BATCH]
+            i, j = pair_i[batch], pair_j[batch]
+            
+            # Common characters bound the longest common subsequence, and ratio = 2 * LCS / (len_i + len_j)
+            shared = np.minimum(histograms[i], histograms[j]).sum(axis=1)
+            keep.append(batch[200 * shared >= similarity_threshold * (lengths[i] + lengths[j])])
+        
+        return np.concatenate(keep)
+    
+    def _format_time_differences(self, total_seconds: np.ndarray) -> List[str]:
+        """Format whole-second time differences as H:MM:SS strings."""
+        hours, remainder = np.divmod(total_seconds, 3600)
+        minutes, seconds = np.divmod(remainder, 60)
+        return [f"{h}:{m:02d}:{sec:02d}" for h, m, sec in zip(hours.tolist(), minutes.tolist(), seconds.tolist())]
     
     def get_summary_stats(self) -> Dict[int, Dict]:
         """Get summary statistics for each time window."""
         stats = {}
         
         for time_window, duplicates in self.results.items():
-            unique_sites = set()
-            unique_tickets = set()
-            
-            for dup in duplicates:
-                unique_sites.add(dup['site'])
-                unique_tickets.add(dup['ticket1_number'])
-                unique_tickets.add(dup['ticket2_number'])
+            columns = self.pair_columns.get(time_window) or {}
+            sites = columns.get('site', [])
+            tickets = columns.get('ticket1_number', []) + columns.get('ticket2_number', [])
+            scores = np.asarray(columns.get('similarity_score', []), dtype=np.int64)
             
+            # Distinct counts and the mean are hash/reduction kernels over whole columns
             stats[time_window] = {
                 'total_pairs': len(duplicates),
-                'affected_sites': len(unique_sites),
-                'unique_tickets_involved': len(unique_tickets),
-                'avg_similarity': sum(dup['similarity_score'] for dup in duplicates) / len(duplicates) if duplicates else 0
+                'affected_sites': len(pd.unique(pd.Series(sites, dtype=object))),
+                'unique_tickets_involved': len(pd.unique(pd.Series(tickets, dtype=object))),
+                'avg_similarity': float(scores.mean()) if duplicates else 0
             }
         
         return stats
     
     def export_results(self, time_windows: List[int] = None) -> pd.DataFrame:
-        """Export results as a pandas DataFrame."""
-        all_results = []
-        
+        """Export results as a pandas DataFrame, built straight from the per-window pair columns."""
         windows_to_export = time_windows if time_windows is not None else list(self.results.keys())
+        fields = {
+            'Time_Window_Hours': 'time_window_hours',
+            'Site': 'site',
+            'Ticket_1_Number': 'ticket1_number',
+            'Ticket_1_Description': 'ticket1_description',
+            'Ticket_1_Created': 'ticket1_created',
+            'Ticket_2_Number': 'ticket2_number',
+            'Ticket_2_Description': 'ticket2_description',
+            'Ticket_2_Created': 'ticket2_created',
+            'Time_Difference': 'time_difference_formatted',
+            'Similarity_Score': 'similarity_score'
+        }
+        
+        window_columns = [self.pair_columns[time_window] for time_window in windows_to_export
+                          if self.pair_columns[time_window].get('similarity_score')]
+        if not window_columns:
+            return pd.DataFrame()
         
-        for time_window in windows_to_export:
-            for duplicate in self.results[time_window]:
-                all_results.append({
-                    'Time_Window_Hours': duplicate['time_window_hours'],
-                    'Site': duplicate['site'],
-                    'Ticket_1_Number': duplicate['ticket1_number'],
-                    'Ticket_1_Description': duplicate['ticket1_description'],
-                    'Ticket_1_Created': duplicate['ticket1_created'],
-                    'Ticket_2_Number': duplicate['ticket2_number'],
-                    'Ticket_2_Description': duplicate['ticket2_description'],
-                    'Ticket_2_Created': duplicate['ticket2_created'],
-                    'Time_Difference': duplicate['time_difference_formatted'],
-                    'Similarity_Score': duplicate['similarity_score']
-                })
-        
-        return pd.DataFrame(all_results)
\ No newline at end of file
+        return pd.DataFrame({column: [value for columns in window_columns for value in columns[key]]
+                             for column, key in fields.items()})
\ No newline at end of file
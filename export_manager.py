@@ -1,16 +1,66 @@
+import numpy as np
 import pandas as pd
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from typing import Tuple
 
+try:
+    import pyarrow
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 class ExportManager:
-    """Handles exporting analysis results to various formats (CSV, Excel) with enhanced multi-sheet support."""
+    """Handles exporting analysis results to various formats (CSV, Excel, Parquet, Feather) with enhanced multi-sheet support."""
+    
+    # Workbook options and header style matching what pandas.DataFrame.to_excel produced;
+    # constant_memory flushes each row to disk once the next one starts
+    WORKBOOK_OPTIONS = {'default_date_format': 'yyyy-mm-dd hh:mm:ss', 'constant_memory': True}
+    HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+    
+    # Buffer size for CSV file handles
+    CSV_BUFFER_SIZE = 1 << 20
+    
+    # Text formats that get a sibling Parquet file when prefer_columnar is set
+    COLUMNAR_SIBLING_EXTENSIONS = ('.csv', '.xlsx', '.xls')
+    
+    def __init__(self, chunksize: int = 100_000, prefer_columnar: bool = False):
+        # Rows per batch when pandas writes CSV files
+        self.chunksize = chunksize
+        
+        # Also write a Parquet copy next to CSV/Excel exports, in the background
+        self.prefer_columnar = prefer_columnar
+        self.columnar_export = None  # Future of the latest sibling Parquet export
+        self._pool = ThreadPoolExecutor(max_workers=1)  # Background exports, one at a time
+        
+        # Export method for each supported file extension
+        self._handlers = {
+            '.csv': self._export_csv,
+            '.xlsx': self._export_excel,
+            '.xls': self._export_excel,
+            '.parquet': self._export_parquet,
+            '.feather': self._export_feather
+        }
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
-    def __init__(self):
-        pass
+    def close(self):
+        """Wait for background exports to finish and release the worker thread."""
+        self._pool.shutdown(wait=True)
     
     def export_data(self, data: pd.DataFrame, file_path: str) -> Tuple[bool, str]:
         """
-        Export DataFrame to CSV or Excel format based on file extension.
+        Export DataFrame to CSV, Excel, Parquet or Feather format based on file extension.
+        
+        With prefer_columnar set, a successful CSV or Excel export is followed by a
+        Parquet copy beside it, written on a background thread (see columnar_export).
         
         Args:
             data: DataFrame containing the results to export
@@ -25,17 +75,40 @@ class ExportManager:
             
             file_extension = os.path.splitext(file_path)[1].lower()
             
-            if file_extension == '.csv':
-                return self._export_csv(data, file_path)
-            elif file_extension in ['.xlsx', '.xls']:
-                return self._export_excel(data, file_path)
-            else:
+            handler = self._handlers.get(file_extension)
+            if handler is None:
                 # Default to CSV if extension is unclear
-                return self._export_csv(data, file_path + '.csv')
+                file_path += '.csv'
+                file_extension, handler = '.csv', self._export_csv
+            success, message = handler(data, file_path)
+            
+            if success and self.prefer_columnar and HAS_PYARROW and file_extension in self.COLUMNAR_SIBLING_EXTENSIONS:
+                parquet_path = os.path.splitext(file_path)[0] + '.parquet'
+                try:
+                    self.columnar_export = self._pool.submit(self._export_parquet, data, parquet_path)
+                except RuntimeError:
+                    # Worker already shut down by close(): write the copy here instead
+                    self.columnar_export = Future()
+                    self.columnar_export.set_result(self._export_parquet(data, parquet_path))
+            
+            return success, message
                 
         except Exception as e:
             return False, f"Export failed: {str(e)}"
     
+    def export_data_async(self, data: pd.DataFrame, file_path: str) -> Future:
+        """
+        Run export_data on the background worker so the caller can carry on meanwhile.
+        
+        Args:
+            data: DataFrame containing the results to export; must not be modified until done
+            file_path: Target file path with extension
+            
+        Returns:
+            Future resolving to the export_data (success: bool, message: str) tuple
+        """
+        return self._pool.submit(self.export_data, data, file_path)
+    
     def export_enhanced_data(self, enhanced_results: dict, file_path: str, 
                            enable_same_day: bool = False, enable_rapid_fire: bool = False, 
                            enable_exact_match: bool = False, enable_category_patterns: bool = False) -> Tuple[bool, str]:
@@ -84,7 +157,7 @@ class ExportManager:
             Tuple of (success: bool, message: str)
         """
         try:
-            data.to_csv(file_path, index=False, encoding='utf-8')
+            self._write_csv(data, file_path)
             return True, f"Successfully exported {len(data)} records to CSV file."
             
         except PermissionError:
@@ -92,6 +165,95 @@ class ExportManager:
         except Exception as e:
             return False, f"CSV export failed: {str(e)}"
     
+    def _write_csv(self, data: pd.DataFrame, file_path: str):
+        """
+        Write a DataFrame as UTF-8 CSV, using the multi-threaded pyarrow writer when available.
+        
+        pyarrow leaves values unquoted when no text contains a separator, quote or line
+        break, and otherwise quotes every text value; columns it cannot convert fall back
+        to pandas, which writes the rows in batches of ``chunksize``. Both go through one
+        large buffer.
+        
+        Args:
+            data: DataFrame to write
+            file_path: Target CSV file path
+        """
+        if HAS_PYARROW:
+            try:
+                table = pyarrow.Table.from_pandas(data, preserve_index=False)
+                with open(file_path, 'wb', buffering=self.CSV_BUFFER_SIZE) as f:
+                    if self._needs_quoting(table):
+                        pa_csv.write_csv(table, f)
+                    else:
+                        # pyarrow always quotes the header, so write the plain one ourselves
+                        f.write((','.join(table.column_names) + '\n').encode('utf-8'))
+                        pa_csv.write_csv(table, f, pa_csv.WriteOptions(include_header=False, quoting_style='none'))
+                return
+            except pyarrow.ArrowException:
+                pass
+        
+        with open(file_path, 'wb', buffering=self.CSV_BUFFER_SIZE) as f:
+            data.to_csv(f, index=False, encoding='utf-8', chunksize=self.chunksize)
+    
+    CSV_STRUCTURAL_CHARACTERS = r'[,"\r\n]'
+    
+    def _needs_quoting(self, table) -> bool:
+        """Check whether any header or text value of an Arrow table contains CSV structural characters."""
+        if any(pa_compute.match_substring_regex(pyarrow.array(table.column_names, pyarrow.string()),
+                                                self.CSV_STRUCTURAL_CHARACTERS).to_pylist()):
+            return True
+        for column in table.columns:
+            if pyarrow.types.is_string(column.type) or pyarrow.types.is_large_string(column.type):
+                if pa_compute.any(pa_compute.match_substring_regex(column, self.CSV_STRUCTURAL_CHARACTERS)).as_py():
+                    return True
+        return False
+    
+    def _export_parquet(self, data: pd.DataFrame, file_path: str) -> Tuple[bool, str]:
+        """
+        Export DataFrame to a zstd-compressed Parquet file.
+        
+        Args:
+            data: DataFrame to export
+            file_path: Target Parquet file path
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not HAS_PYARROW:
+            return False, "Parquet export requires pyarrow. Please install it: pip install pyarrow"
+        
+        try:
+            data.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False)
+            return True, f"Successfully exported {len(data)} records to Parquet file."
+            
+        except PermissionError:
+            return False, "Permission denied. Please ensure the file is not open in another application."
+        except Exception as e:
+            return False, f"Parquet export failed: {str(e)}"
+    
+    def _export_feather(self, data: pd.DataFrame, file_path: str) -> Tuple[bool, str]:
+        """
+        Export DataFrame to an LZ4-compressed Feather file.
+        
+        Args:
+            data: DataFrame to export
+            file_path: Target Feather file path
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not HAS_PYARROW:
+            return False, "Feather export requires pyarrow. Please install it: pip install pyarrow"
+        
+        try:
+            data.to_feather(file_path, compression='lz4')
+            return True, f"Successfully exported {len(data)} records to Feather file."
+            
+        except PermissionError:
+            return False, "Permission denied. Please ensure the file is not open in another application."
+        except Exception as e:
+            return False, f"Feather export failed: {str(e)}"
+    
     def _export_excel(self, data: pd.DataFrame, file_path: str) -> Tuple[bool, str]:
         """
         Export DataFrame to Excel format with formatting.
@@ -104,102 +266,198 @@ class ExportManager:
             Tuple of (success: bool, message: str)
         """
         try:
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                # Write main data
-                data.to_excel(writer, sheet_name='Duplicate_Tickets', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Duplicate_Tickets']
+            import xlsxwriter
+            
+            record_count = len(data)
+            
+            # Open the target up front so a locked file surfaces as PermissionError
+            with open(file_path, 'wb') as f, xlsxwriter.Workbook(f, self.WORKBOOK_OPTIONS) as workbook:
+                header_format = workbook.add_format(self.HEADER_FORMAT)
                 
-                # Auto-adjust column widths
-                self._adjust_excel_columns(worksheet)
+                # Write main data with auto-adjusted column widths
+                self._write_sheet(workbook, 'Duplicate_Tickets', data, header_format)
                 
                 # Add summary sheet if there's data
-                if not data.empty:
-                    self._add_summary_sheet(writer, data)
+                if record_count:
+                    self._add_summary_sheet(workbook, data, header_format)
             
-            return True, f"Successfully exported {len(data)} records to Excel file."
+            return True, f"Successfully exported {record_count} records to Excel file."
             
         except ImportError:
-            return False, "Excel export requires openpyxl. Please install it: pip install openpyxl"
+            return False, "Excel export requires xlsxwriter. Please install it: pip install xlsxwriter"
         except PermissionError:
             return False, "Permission denied. Please ensure the file is not open in another application."
         except Exception as e:
             return False, f"Excel export failed: {str(e)}"
     
-    def _adjust_excel_columns(self, worksheet):
-        """Auto-adjust column widths in Excel worksheet."""
+    def _write_sheet(self, workbook, sheet_name: str, data: pd.DataFrame, header_format):
+        """
+        Write a DataFrame to a new worksheet row by row, bypassing pandas' per-cell formatter.
+        
+        Column widths are set before any row so the sheet can be streamed in
+        constant_memory mode, which only accepts rows in ascending order.
+        
+        Args:
+            workbook: Open xlsxwriter Workbook
+            sheet_name: Name of the worksheet to add
+            data: DataFrame to write, header row first
+            header_format: Workbook format applied to the header cells
+            
+        Returns:
+            The new worksheet
+        """
+        worksheet = workbook.add_worksheet(sheet_name)
+        self._adjust_excel_columns(worksheet, data)
+        worksheet.write_row(0, 0, [str(column) for column in data.columns], header_format)
+        
+        # Native Python values per column; missing values become blank cells
+        columns = [data[column].astype(object).where(data[column].notna(), None).tolist()
+                   for column in data.columns]
+        for row_index, row in enumerate(zip(*columns), 1):
+            worksheet.write_row(row_index, 0, row)
+        
+        return worksheet
+    
+    def _write_rows(self, workbook, sheet_name: str, header: list, rows: list, header_format):
+        """
+        Write a short list of rows to a new worksheet without building a DataFrame.
+        
+        Args:
+            workbook: Open xlsxwriter Workbook
+            sheet_name: Name of the worksheet to add
+            header: Column names
+            rows: Row tuples in column order
+            header_format: Workbook format applied to the header cells
+            
+        Returns:
+            The new worksheet
+        """
+        worksheet = workbook.add_worksheet(sheet_name)
+        
+        # Same widths as _column_widths, measured over the handful of values directly
+        for column_index, values in enumerate(zip(header, *rows)):
+            width = min(max(len(str(value)) for value in values) + 2, 50)
+            worksheet.set_column(column_index, column_index, width)
+        
+        worksheet.write_row(0, 0, header, header_format)
+        for row_index, row in enumerate(rows, 1):
+            worksheet.write_row(row_index, 0, row)
+        
+        return worksheet
+    
+    def _adjust_excel_columns(self, worksheet, data: pd.DataFrame):
+        """Auto-adjust column widths in Excel worksheet from the DataFrame written to it."""
         try:
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        cell_length = len(str(cell.value)) if cell.value is not None else 0
-                        max_length = max(max_length, cell_length)
-                    except:
-                        pass
-                
-                # Set width with some padding, but cap it at reasonable maximum
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+            for column_index, width in enumerate(self._column_widths(data)):
+                worksheet.set_column(column_index, column_index, width)
                 
         except Exception:
             # If auto-adjustment fails, continue without it
             pass
     
-    def _add_summary_sheet(self, writer, data: pd.DataFrame):
+    @staticmethod
+    def _column_widths(data: pd.DataFrame) -> list:
+        """
+        Compute display widths for each column without touching the worksheet.
+        
+        Args:
+            data: DataFrame whose values will be written
+            
+        Returns:
+            Width per column: longest of the header and cell text plus padding, capped at 50
+        """
+        if not len(data):
+            # Header-only sheet: nothing to measure
+            return [min(len(str(column)) + 2, 50) for column in data.columns]
+        
+        widths = []
+        for column in data.columns:
+            values = data[column].dropna()
+            max_length = len(str(column))
+            if len(values):
+                if pd.api.types.is_integer_dtype(values.dtype):
+                    # Integer text is longest at one of the extremes
+                    max_length = max(max_length, len(str(values.min())), len(str(values.max())))
+                else:
+                    # Longest cell value, measured in one vectorized pass; text columns
+                    # are measured in place rather than stringified again
+                    if not isinstance(values.dtype, pd.StringDtype):
+                        values = values.astype(str)
+                    max_length = max(max_length, int(values.str.len().max()))
+            
+            # Set width with some padding, but cap it at reasonable maximum
+            widths.append(min(max_length + 2, 50))
+        return widths
+    
+    def _add_summary_sheet(self, workbook, data: pd.DataFrame, header_format):
         """Add a summary sheet to the Excel export."""
         try:
-            # Create summary statistics
-            summary_data = []
-            
             # Overall statistics
             total_pairs = len(data)
             unique_sites = data['Site'].nunique() if 'Site' in data.columns else 0
             
-            # Time window breakdown
+            # Time window breakdown, one row per window in ascending order
+            summary_rows = []
             if 'Time_Window_Hours' in data.columns:
-                time_window_counts = data['Time_Window_Hours'].value_counts().sort_index()
-                
-                for window, count in time_window_counts.items():
-                    summary_data.append({
-                        'Metric': f'Duplicates within {window} hours',
-                        'Value': count
-                    })
+                windows = data['Time_Window_Hours'].to_numpy()
+                if windows.dtype.kind in 'iu' and windows.min() >= 0:
+                    # Whole-hour windows: one counting pass, already in ascending order
+                    counts = np.bincount(windows)
+                    time_window_counts = pd.Series(counts[counts > 0], index=np.flatnonzero(counts))
+                else:
+                    time_window_counts = data.groupby('Time_Window_Hours').size()
+                summary_rows += [(f'Duplicates within {window} hours', int(count))
+                                 for window, count in time_window_counts.items()]
             
             # Add overall metrics
-            summary_data.extend([
-                {'Metric': 'Total duplicate pairs', 'Value': total_pairs},
-                {'Metric': 'Unique sites affected', 'Value': unique_sites}
-            ])
+            summary_rows += [
+                ('Total duplicate pairs', total_pairs),
+                ('Unique sites affected', unique_sites)
+            ]
             
             # Similarity statistics
             if 'Similarity_Score' in data.columns:
-                avg_similarity = data['Similarity_Score'].mean()
-                max_similarity = data['Similarity_Score'].max()
-                min_similarity = data['Similarity_Score'].min()
-                
-                summary_data.extend([
-                    {'Metric': 'Average similarity score', 'Value': f'{avg_similarity:.1f}%'},
-                    {'Metric': 'Highest similarity score', 'Value': f'{max_similarity}%'},
-                    {'Metric': 'Lowest similarity score', 'Value': f'{min_similarity}%'}
-                ])
-            
-            # Create summary DataFrame and export
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                average, highest, lowest = self._similarity_stats(data['Similarity_Score'])
+                summary_rows += [
+                    ('Average similarity score', f'{average:.1f}%'),
+                    ('Highest similarity score', f'{highest}%'),
+                    ('Lowest similarity score', f'{lowest}%')
+                ]
             
-            # Auto-adjust summary sheet columns
-            summary_worksheet = writer.sheets['Summary']
-            self._adjust_excel_columns(summary_worksheet)
+            # Export the rows as they are with auto-adjusted columns
+            self._write_rows(workbook, 'Summary', ['Metric', 'Value'], summary_rows, header_format)
             
         except Exception:
             # If summary creation fails, continue without it
             pass
     
+    @staticmethod
+    def _similarity_stats(similarity: pd.Series) -> Tuple[float, object, object]:
+        """
+        Mean, max and min of the similarity scores.
+        
+        Integer percentage scores are tallied once with bincount and all three
+        statistics are read off the tally; other dtypes use pandas reductions.
+        
+        Args:
+            similarity: Similarity score column
+            
+        Returns:
+            Tuple of (mean, max, min)
+        """
+        if pd.api.types.is_integer_dtype(similarity.dtype) and len(similarity) and not similarity.hasnans:
+            scores = similarity.to_numpy()
+            try:
+                counts = np.bincount(scores, minlength=101)
+            except (TypeError, ValueError):
+                # Negative or unsigned 64-bit scores cannot be tallied
+                counts = None
+            if counts is not None:
+                present = np.flatnonzero(counts)
+                average = float(counts @ np.arange(counts.size)) / scores.size
+                return average, scores.dtype.type(present[-1]), scores.dtype.type(present[0])
+        return similarity.mean(), similarity.max(), similarity.min()
+    
     def _export_enhanced_excel(self, enhanced_results: dict, file_path: str,
                               enable_same_day: bool, enable_rapid_fire: bool, 
                               enable_exact_match: bool, enable_category_patterns: bool) -> Tuple[bool, str]:
@@ -218,59 +476,41 @@ class ExportManager:
             Tuple of (success: bool, message: str)
         """
         try:
-            sheets_created = 0
-            
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                
+            # Convert every enabled analysis first so the writer only does I/O
+            sheets = {
                 # Primary sheet - Fuzzy matching duplicates (always included)
-                primary_data = self._convert_fuzzy_results_to_dataframe(enhanced_results.get('fuzzy_matching', {}))
-                if not primary_data.empty:
-                    primary_data.to_excel(writer, sheet_name='Duplicate_Tickets', index=False)
-                    self._adjust_excel_columns(writer.sheets['Duplicate_Tickets'])
-                    sheets_created += 1
-                
-                # Same-day duplicates sheet
-                if enable_same_day and 'same_day' in enhanced_results:
-                    same_day_data = self._convert_same_day_to_dataframe(enhanced_results['same_day'])
-                    if not same_day_data.empty:
-                        same_day_data.to_excel(writer, sheet_name='Same_Day_Duplicates', index=False)
-                        self._adjust_excel_columns(writer.sheets['Same_Day_Duplicates'])
-                        sheets_created += 1
-                
-                # Rapid-fire duplicates sheet
-                if enable_rapid_fire and 'rapid_fire' in enhanced_results:
-                    rapid_fire_data = self._convert_rapid_fire_to_dataframe(enhanced_results['rapid_fire'])
-                    if not rapid_fire_data.empty:
-                        rapid_fire_data.to_excel(writer, sheet_name='Rapid_Fire_Duplicates', index=False)
-                        self._adjust_excel_columns(writer.sheets['Rapid_Fire_Duplicates'])
-                        sheets_created += 1
-                
-                # Exact matches sheet
-                if enable_exact_match and 'exact_match' in enhanced_results:
-                    exact_match_data = self._convert_exact_match_to_dataframe(enhanced_results['exact_match'])
-                    if not exact_match_data.empty:
-                        exact_match_data.to_excel(writer, sheet_name='Exact_Matches', index=False)
-                        self._adjust_excel_columns(writer.sheets['Exact_Matches'])
-                        sheets_created += 1
+                'Duplicate_Tickets': self._convert_fuzzy_results_to_dataframe(enhanced_results.get('fuzzy_matching', {}))
+            }
+            if enable_same_day and 'same_day' in enhanced_results:
+                sheets['Same_Day_Duplicates'] = self._convert_same_day_to_dataframe(enhanced_results['same_day'])
+            if enable_rapid_fire and 'rapid_fire' in enhanced_results:
+                sheets['Rapid_Fire_Duplicates'] = self._convert_rapid_fire_to_dataframe(enhanced_results['rapid_fire'])
+            if enable_exact_match and 'exact_match' in enhanced_results:
+                sheets['Exact_Matches'] = self._convert_exact_match_to_dataframe(enhanced_results['exact_match'])
+            if enable_category_patterns and 'category_patterns' in enhanced_results:
+                sheets['Category_Patterns'] = self._convert_category_patterns_to_dataframe(enhanced_results['category_patterns'])
+            sheets = {sheet_name: sheet_data for sheet_name, sheet_data in sheets.items() if not sheet_data.empty}
+            
+            import xlsxwriter
+            
+            # Open the target up front so a locked file surfaces as PermissionError
+            with open(file_path, 'wb') as f, xlsxwriter.Workbook(f, self.WORKBOOK_OPTIONS) as workbook:
+                header_format = workbook.add_format(self.HEADER_FORMAT)
                 
-                # Category patterns sheet
-                if enable_category_patterns and 'category_patterns' in enhanced_results:
-                    category_data = self._convert_category_patterns_to_dataframe(enhanced_results['category_patterns'])
-                    if not category_data.empty:
-                        category_data.to_excel(writer, sheet_name='Category_Patterns', index=False)
-                        self._adjust_excel_columns(writer.sheets['Category_Patterns'])
-                        sheets_created += 1
+                # Write the analysis sheets back to back
+                for sheet_name, sheet_data in sheets.items():
+                    self._write_sheet(workbook, sheet_name, sheet_data, header_format)
                 
                 # Enhanced summary sheet
-                self._add_enhanced_summary_sheet(writer, enhanced_results, 
+                self._add_enhanced_summary_sheet(workbook, header_format, enhanced_results, 
                                                 enable_same_day, enable_rapid_fire,
                                                 enable_exact_match, enable_category_patterns)
-                sheets_created += 1
+            sheets_created = len(sheets) + 1
             
             return True, f"Successfully exported {sheets_created} analysis sheets to Excel file."
             
         except ImportError:
-            return False, "Excel export requires openpyxl. Please install it: pip install openpyxl"
+            return False, "Excel export requires xlsxwriter. Please install it: pip install xlsxwriter"
         except PermissionError:
             return False, "Permission denied. Please ensure the file is not open in another application."
         except Exception as e:
@@ -278,98 +518,113 @@ class ExportManager:
     
     def _convert_fuzzy_results_to_dataframe(self, fuzzy_results) -> pd.DataFrame:
         """Convert fuzzy matching results to DataFrame (handles both new list format and legacy dict format)."""
-        all_results = []
+        fields = {
+            'Site': 'site',
+            'Ticket_1_Number': 'ticket1_number',
+            'Ticket_1_Description': 'ticket1_description',
+            'Ticket_1_Created': 'ticket1_created',
+            'Ticket_2_Number': 'ticket2_number',
+            'Ticket_2_Description': 'ticket2_description',
+            'Ticket_2_Created': 'ticket2_created',
+            'Time_Difference': 'time_difference_formatted',
+            'Time_Difference_Hours': 'time_difference_hours',
+            'Time_Category': 'time_category',
+            'Similarity_Score': 'similarity_score'
+        }
+        defaults = {'time_difference_hours': 0, 'time_category': 'N/A'}
         
         if isinstance(fuzzy_results, list):
             # New format: list of duplicate pairs
-            for duplicate in fuzzy_results:
-                all_results.append({
-                    'Site': duplicate['site'],
-                    'Ticket_1_Number': duplicate['ticket1_number'],
-                    'Ticket_1_Description': duplicate['ticket1_description'],
-                    'Ticket_1_Created': duplicate['ticket1_created'],
-                    'Ticket_2_Number': duplicate['ticket2_number'],
-                    'Ticket_2_Description': duplicate['ticket2_description'],
-                    'Ticket_2_Created': duplicate['ticket2_created'],
-                    'Time_Difference': duplicate['time_difference_formatted'],
-                    'Time_Difference_Hours': duplicate.get('time_difference_hours', 0),
-                    'Time_Category': duplicate.get('time_category', 'N/A'),
-                    'Similarity_Score': duplicate['similarity_score']
-                })
-        else:
-            # Legacy format: dictionary with time windows
-            for time_window, duplicates in fuzzy_results.items():
-                for duplicate in duplicates:
-                    all_results.append({
-                        'Time_Window_Hours': duplicate.get('time_window_hours', time_window),
-                        'Site': duplicate['site'],
-                        'Ticket_1_Number': duplicate['ticket1_number'],
-                        'Ticket_1_Description': duplicate['ticket1_description'],
-                        'Ticket_1_Created': duplicate['ticket1_created'],
-                        'Ticket_2_Number': duplicate['ticket2_number'],
-                        'Ticket_2_Description': duplicate['ticket2_description'],
-                        'Ticket_2_Created': duplicate['ticket2_created'],
-                        'Time_Difference': duplicate['time_difference_formatted'],
-                        'Time_Difference_Hours': duplicate.get('time_difference_hours', 0),
-                        'Time_Category': duplicate.get('time_category', 'N/A'),
-                        'Similarity_Score': duplicate['similarity_score']
-                    })
+            return self._records_to_frame(fuzzy_results, fields, defaults)
         
-        return pd.DataFrame(all_results)
+        # Legacy format: dictionary with time windows
+        duplicates = [duplicate for duplicates in fuzzy_results.values() for duplicate in duplicates]
+        data = self._records_to_frame(duplicates, fields, defaults)
+        if not data.empty:
+            data.insert(0, 'Time_Window_Hours', [duplicate.get('time_window_hours', time_window)
+                                                 for time_window, duplicates in fuzzy_results.items()
+                                                 for duplicate in duplicates])
+        return data
     
     def _convert_same_day_to_dataframe(self, same_day_results: list) -> pd.DataFrame:
         """Convert same-day results to DataFrame."""
-        return pd.DataFrame([{
-            'Site': result['site'],
-            'Date': result['date'],
-            'Ticket_Count': result['ticket_count'],
-            'Ticket_Numbers': result['ticket_numbers'],
-            'Category_Mix': result['category_mix'],
-            'Priority_Mix': result['priority_mix'],
-            'Time_Span': result['time_span'],
-            'Earliest_Time': result['earliest_time'],
-            'Latest_Time': result['latest_time']
-        } for result in same_day_results])
+        return self._records_to_frame(same_day_results, {
+            'Site': 'site',
+            'Date': 'date',
+            'Ticket_Count': 'ticket_count',
+            'Ticket_Numbers': 'ticket_numbers',
+            'Category_Mix': 'category_mix',
+            'Priority_Mix': 'priority_mix',
+            'Time_Span': 'time_span',
+            'Earliest_Time': 'earliest_time',
+            'Latest_Time': 'latest_time'
+        })
     
     def _convert_rapid_fire_to_dataframe(self, rapid_fire_results: list) -> pd.DataFrame:
         """Convert rapid-fire results to DataFrame."""
-        return pd.DataFrame([{
-            'Site': result['site'],
-            'Time_Window_Minutes': result['time_window_minutes'],
-            'Ticket_1': result['ticket_1'],
-            'Ticket_1_Description': result['ticket_1_description'],
-            'Ticket_1_Created': result['ticket_1_created'],
-            'Ticket_2': result['ticket_2'],
-            'Ticket_2_Description': result['ticket_2_description'],
-            'Ticket_2_Created': result['ticket_2_created'],
-            'Time_Difference': result['time_difference'],
-            'Similarity_Score': result['similarity_score']
-        } for result in rapid_fire_results])
+        return self._records_to_frame(rapid_fire_results, {
+            'Site': 'site',
+            'Time_Window_Minutes': 'time_window_minutes',
+            'Ticket_1': 'ticket_1',
+            'Ticket_1_Description': 'ticket_1_description',
+            'Ticket_1_Created': 'ticket_1_created',
+            'Ticket_2': 'ticket_2',
+            'Ticket_2_Description': 'ticket_2_description',
+            'Ticket_2_Created': 'ticket_2_created',
+            'Time_Difference': 'time_difference',
+            'Similarity_Score': 'similarity_score'
+        })
     
     def _convert_exact_match_to_dataframe(self, exact_match_results: list) -> pd.DataFrame:
         """Convert exact match results to DataFrame."""
-        return pd.DataFrame([{
-            'Site': result['site'],
-            'Description': result['description'],
-            'Ticket_Count': result['ticket_count'],
-            'Ticket_Numbers': result['ticket_numbers'],
-            'Date_Range': result['date_range'],
-            'Category': result['category']
-        } for result in exact_match_results])
+        return self._records_to_frame(exact_match_results, {
+            'Site': 'site',
+            'Description': 'description',
+            'Ticket_Count': 'ticket_count',
+            'Ticket_Numbers': 'ticket_numbers',
+            'Date_Range': 'date_range',
+            'Category': 'category'
+        })
     
     def _convert_category_patterns_to_dataframe(self, category_results: list) -> pd.DataFrame:
         """Convert category patterns results to DataFrame."""
-        return pd.DataFrame([{
-            'Site': result['site'],
-            'Date': result['date'],
-            'Category': result['category'],
-            'Subcategory': result['subcategory'],
-            'Ticket_Count': result['ticket_count'],
-            'Ticket_Numbers': result['ticket_numbers'],
-            'Priority_Distribution': result['priority_distribution']
-        } for result in category_results])
+        return self._records_to_frame(category_results, {
+            'Site': 'site',
+            'Date': 'date',
+            'Category': 'category',
+            'Subcategory': 'subcategory',
+            'Ticket_Count': 'ticket_count',
+            'Ticket_Numbers': 'ticket_numbers',
+            'Priority_Distribution': 'priority_distribution'
+        })
+    
+    @staticmethod
+    def _records_to_frame(records: list, fields: dict, defaults: dict = None) -> pd.DataFrame:
+        """
+        Build a DataFrame column by column from result dictionaries.
+        
+        Args:
+            records: Result dictionaries
+            fields: Record key for each output column, in column order
+            defaults: Fallback values for keys that records may omit
+            
+        Returns:
+            DataFrame with one row per record (no columns when there are no records)
+        """
+        if not records:
+            return pd.DataFrame()
+        
+        # One list per column, pulled with a C-level key getter rather than a dict per row
+        defaults = defaults or {}
+        columns = {}
+        for column, key in fields.items():
+            if key in defaults:
+                columns[column] = [record.get(key, defaults[key]) for record in records]
+            else:
+                columns[column] = list(map(itemgetter(key), records))
+        return pd.DataFrame(columns)
     
-    def _add_enhanced_summary_sheet(self, writer, enhanced_results: dict,
+    def _add_enhanced_summary_sheet(self, workbook, header_format, enhanced_results: dict,
                                    enable_same_day: bool, enable_rapid_fire: bool,
                                    enable_exact_match: bool, enable_category_patterns: bool):
         """Add an enhanced summary sheet with statistics from all analysis types."""
@@ -436,11 +691,10 @@ class ExportManager:
                         'Description': 'Same category/subcategory on same day'
                     })
             
-            # Create and export summary DataFrame
+            # Export the summary rows directly
             if summary_data:
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Analysis_Summary', index=False)
-                self._adjust_excel_columns(writer.sheets['Analysis_Summary'])
+                self._write_rows(workbook, 'Analysis_Summary', list(summary_data[0]),
+                                 [tuple(row.values()) for row in summary_data], header_format)
             
         except Exception:
             # If enhanced summary creation fails, continue without it
@@ -8,10 +8,139 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
 import os
+import numpy as np
+from functools import lru_cache, partial
+from operator import itemgetter
+from types import SimpleNamespace
 from csv_parser import CSVParser
 from duplicate_detector import DuplicateDetector
 from export_manager import ExportManager
 
+# Filling rows from Tcl avoids a Python-to-Tcl round trip per Treeview item.
+# Existing items are reused for the new page, so scrolling only rewrites their
+# values; the selection is cleared because it belonged to the previous rows.
+FILL_ROWS_PROC = """
+proc dplkt_fill_rows {tree rows} {
+    set items [$tree children {}]
+    set index 0
+    foreach row $rows {
+        if {$index < [llength $items]} {
+            $tree item [lindex $items $index] -values $row
+        } else {
+            $tree insert {} end -values $row
+        }
+        incr index
+    }
+    if {$index < [llength $items]} {
+        $tree delete [lrange $items $index end]
+    }
+    $tree selection set {}
+}
+"""
+
+@lru_cache(maxsize=128)
+def similarity_label(score):
+    """
+    Similarity column text: the score with a red/yellow/green marker for its tier;
+    memoized because scores are whole percentages, so only a handful of labels exist.
+    """
+    if score >= 95:
+        marker = "🔴"
+    elif score >= 90:
+        marker = "🟡"
+    else:
+        marker = "🟢"
+    return f"{marker} {score}%"
+
+class VirtualTreeview:
+    """Drives a Treeview that only ever holds the rows currently scrolled into view."""
+    
+    # Fallback Treeview row and heading heights in pixels, before the widget is mapped
+    ROW_HEIGHT = 20
+    HEADING_HEIGHT = 25
+    
+    # Rows moved per mouse wheel notch
+    WHEEL_ROWS = 3
+    
+    def __init__(self, tree, scrollbar, rows, sort_keys=None):
+        """
+        Attach the full row list to a Treeview and its vertical scrollbar.
+        
+        Args:
+            tree: Treeview showing a page of rows (no yscrollcommand of its own)
+            scrollbar: Vertical scrollbar that scrolls through all rows
+            rows: Formatted value tuples, one per table row
+            sort_keys: Optional {column index: key array in row order} for columns
+                whose displayed text does not sort correctly as is
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rows = list(rows)
+        self.first = 0
+        
+        # Display order as indexes into rows, and each sorted column's keys in row order
+        self.order = np.arange(len(self.rows))
+        self.sort_keys = dict(sort_keys or {})
+        
+        scrollbar.configure(command=self.yview)
+        tree.bind('<Configure>', lambda event: self.refill())
+        tree.bind('<MouseWheel>', self.on_mousewheel)
+        tree.bind('<Button-4>', self.on_mousewheel)
+        tree.bind('<Button-5>', self.on_mousewheel)
+        self.refill()
+    
+    def page_size(self):
+        """Number of rows that fit in the Treeview at its current size."""
+        # Before the first layout the widget has no real size; use its requested height
+        if not self.tree.winfo_ismapped() or self.tree.winfo_height() <= 1:
+            return int(self.tree.cget('height')) + 1
+        
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or self.ROW_HEIGHT)
+        fitted = (self.tree.winfo_height() - self.HEADING_HEIGHT) // row_height
+        return max(fitted, 1) + 1
+    
+    def refill(self):
+        """Show the page starting at the first visible row in the Treeview items."""
+        page = self.page_size()
+        self.first = max(0, min(self.first, len(self.rows) - page + 1))
+        
+        rows = self.rows
+        page_rows = tuple(rows[index] for index in self.order[self.first:self.first + page])
+        self.tree.tk.call('dplkt_fill_rows', str(self.tree), page_rows)
+        
+        total = len(self.rows) or 1
+        self.scrollbar.set(self.first / total, min(1.0, (self.first + page - 1) / total))
+    
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', count, 'units'|'pages')."""
+        if args[0] == 'moveto':
+            self.first = int(float(args[1]) * len(self.rows))
+        elif args[0] == 'scroll':
+            step = self.page_size() - 1 if args[2] == 'pages' else 1
+            self.first += int(args[1]) * step
+        self.refill()
+    
+    def on_mousewheel(self, event):
+        """Scroll a few rows per wheel notch (Button-4/5 on X11, MouseWheel elsewhere)."""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self.first += direction * self.WHEEL_ROWS
+        self.refill()
+        return 'break'
+    
+    def sort(self, column_index, key, reverse):
+        """Sort every row, not just the visible page, and show the top of the result."""
+        # Keys are computed on the first sort by a column and reused for later clicks
+        keys = self.sort_keys.get(column_index)
+        if keys is None:
+            keys = self.sort_keys[column_index] = np.array([key(row[column_index]) for row in self.rows])
+        
+        # Stable like list.sort: equal keys keep their current order, also when reversed
+        order = self.order[::-1] if reverse else self.order
+        order = order[np.argsort(keys[order], kind='stable')]
+        self.order = order[::-1] if reverse else order
+        self.first = 0
+        self.refill()
+
 class DuplicateTicketApp:
     """Modern, intuitive GUI application for duplicate ticket detection."""
     
@@ -30,6 +159,17 @@ class DuplicateTicketApp:
         self.current_file_path = None
         self.analysis_results = {}
         
+        # Standard export table for the current results, built on the first export
+        self.export_frame = None
+        
+        # Latest analysis progress (message, percent), drawn by _flush_progress
+        self._progress_slot = ("", 0)
+        self._progress_pending = False
+        self._progress_after_id = None
+        
+        # Tcl helper that fills a Treeview from a list of rows in a single call
+        self.root.tk.eval(FILL_ROWS_PROC)
+        
         # Create modern GUI
         self.setup_styles()
         self.create_widgets()
@@ -38,9 +178,74 @@ class DuplicateTicketApp:
         # Initial state
         self.update_ui_state()
     
+    # Custom styles for modern look, applied to the active theme in one batch
+    STYLE_SETTINGS = {
+        'Title.TLabel': {'configure': {'font': ('Segoe UI', 16, 'bold')}},
+        'Subtitle.TLabel': {'configure': {'font': ('Segoe UI', 11, 'bold')}},
+        'Header.TLabel': {'configure': {'font': ('Segoe UI', 12, 'bold')}},
+        'Info.TLabel': {'configure': {'font': ('Segoe UI', 10), 'foreground': '#666666'}},
+        'Success.TLabel': {'configure': {'font': ('Segoe UI', 10), 'foreground': '#2e8b57'}},
+        'Warning.TLabel': {'configure': {'font': ('Segoe UI', 10), 'foreground': '#ff8c00'}},
+        'Error.TLabel': {'configure': {'font': ('Segoe UI', 10), 'foreground': '#dc143c'}},
+        
+        # Button styles
+        'Primary.TButton': {'configure': {'font': ('Segoe UI', 11, 'bold')}},
+        'Secondary.TButton': {'configure': {'font': ('Segoe UI', 10)}},
+        'Success.TButton': {'configure': {'font': ('Segoe UI', 10, 'bold')}},
+        
+        # Frame styles
+        'Card.TFrame': {'configure': {'relief': 'raised', 'borderwidth': 1}},
+        'Section.TLabelframe': {'configure': {'font': ('Segoe UI', 11, 'bold'), 'padding': (15, 10)}},
+        'Modern.TLabelframe': {'configure': {'font': ('Segoe UI', 11, 'bold'), 'padding': (20, 15)}}
+    }
+    
+    # Milliseconds between progress redraws (about 60 per second)
+    PROGRESS_REDRAW_MS = 16
+    
+    # Characters shown in the results table before text is cut off with "..."
+    SITE_TEXT_LENGTH = 25
+    DESCRIPTION_TEXT_LENGTH = 40
+    
+    # Instructions shown on the Welcome tab
+    WELCOME_TEXT = """\
+🎯 Welcome to the ServiceNow Duplicate Detection Tool
+
+📋 Quick Start:
+1. Click 'Select CSV File' to load your ServiceNow export
+2. Set maximum timeframe (how far back to search for duplicates)
+3. Adjust similarity threshold (85% recommended)
+4. Click 'Run Analysis' to detect duplicates
+5. Review results with time categories for easy grouping
+6. Export findings when ready
+
+💡 Tips:
+• Quick (1h): Catches immediate duplicate submissions
+• Standard (24h): Finds duplicates within a business day
+• Comprehensive (72h): Includes weekend duplicates
+• Extended (168h): Full week analysis
+• Each duplicate pair appears only once (no time window overlap)
+
+🛠️ Features:
+• Maximum timeframe approach eliminates duplicate reporting
+• Automatic time categorization (0-1h, 1-4h, 4-8h, etc.)
+• Site-based grouping prevents cross-site matches
+• Enhanced analysis options for Excel exports
+• Automatic CSV repair for corrupted files"""
+    
+    # Slider label text for each threshold from 50 to 100, indexed by threshold - 50
+    SIMILARITY_LABELS = tuple(f"{threshold}%" for threshold in range(50, 101))
+    SIMILARITY_GUIDES = tuple(
+        "Very Strict - Only exact matches" if threshold >= 95 else
+        "Strict - High precision, fewer matches" if threshold >= 90 else
+        "Balanced - Good for most cases" if threshold >= 80 else
+        "Relaxed - More matches, some false positives" if threshold >= 70 else
+        "Very Relaxed - Many matches, review carefully"
+        for threshold in range(50, 101)
+    )
+    
     def setup_styles(self):
         """Configure modern ttk styles."""
-        style = ttk.Style()
+        style = ttk.Style(self.root)
         
         # Use a modern theme if available
         available_themes = style.theme_names()
@@ -49,24 +254,7 @@ class DuplicateTicketApp:
         elif 'alt' in available_themes:
             style.theme_use('alt')
         
-        # Custom styles for modern look
-        style.configure('Title.TLabel', font=('Segoe UI', 16, 'bold'))
-        style.configure('Subtitle.TLabel', font=('Segoe UI', 11, 'bold'))
-        style.configure('Header.TLabel', font=('Segoe UI', 12, 'bold'))
-        style.configure('Info.TLabel', font=('Segoe UI', 10), foreground='#666666')
-        style.configure('Success.TLabel', font=('Segoe UI', 10), foreground='#2e8b57')
-        style.configure('Warning.TLabel', font=('Segoe UI', 10), foreground='#ff8c00')
-        style.configure('Error.TLabel', font=('Segoe UI', 10), foreground='#dc143c')
-        
-        # Button styles
-        style.configure('Primary.TButton', font=('Segoe UI', 11, 'bold'))
-        style.configure('Secondary.TButton', font=('Segoe UI', 10))
-        style.configure('Success.TButton', font=('Segoe UI', 10, 'bold'))
-        
-        # Frame styles
-        style.configure('Card.TFrame', relief='raised', borderwidth=1)
-        style.configure('Section.TLabelframe', font=('Segoe UI', 11, 'bold'), padding=(15, 10))
-        style.configure('Modern.TLabelframe', font=('Segoe UI', 11, 'bold'), padding=(20, 15))
+        style.theme_settings(style.theme_use(), self.STYLE_SETTINGS)
     
     def create_widgets(self):
         """Create all GUI widgets with modern design."""
@@ -167,15 +355,15 @@ class DuplicateTicketApp:
         self.preset_frame.pack(fill='x', pady=(0, 10))
         
         presets = [
-            ("Quick", "1"),
-            ("Standard", "24"),
-            ("Comprehensive", "72"),
-            ("Extended", "168")
+            ("Quick", 1),
+            ("Standard", 24),
+            ("Comprehensive", 72),
+            ("Extended", 168)
         ]
         
         for i, (name, value) in enumerate(presets):
             btn = ttk.Button(self.preset_frame, text=name,
-                           command=lambda v=value: self.set_max_timeframe(v),
+                           command=partial(self.set_max_timeframe, value),
                            style='Secondary.TButton')
             btn.pack(side='left', padx=(0, 5) if i < len(presets)-1 else 0)
         
@@ -301,9 +489,11 @@ class DuplicateTicketApp:
                                         style='Info.TLabel')
         self.results_summary.pack(anchor='w')
         
-        # Tabbed results display
+        # Tabbed results display; result tables are built lazily on first view
         self.results_notebook = ttk.Notebook(self.results_section)
         self.results_notebook.pack(fill='both', expand=True)
+        self.pending_tabs = {}
+        self.results_notebook.bind('<<NotebookTabChanged>>', self.build_selected_tab)
         
         # Welcome tab
         self.create_welcome_tab()
@@ -317,33 +507,12 @@ class DuplicateTicketApp:
         self.welcome_content = ttk.Frame(self.welcome_frame)
         self.welcome_content.pack(expand=True)
         
-        welcome_text = """
-🎯 Welcome to the ServiceNow Duplicate Detection Tool
-
-📋 Quick Start:
-1. Click 'Select CSV File' to load your ServiceNow export
-2. Set maximum timeframe (how far back to search for duplicates)
-3. Adjust similarity threshold (85% recommended)
-4. Click 'Run Analysis' to detect duplicates
-5. Review results with time categories for easy grouping
-6. Export findings when ready
-
-💡 Tips:
-• Quick (1h): Catches immediate duplicate submissions
-• Standard (24h): Finds duplicates within a business day
-• Comprehensive (72h): Includes weekend duplicates
-• Extended (168h): Full week analysis
-• Each duplicate pair appears only once (no time window overlap)
-
-🛠️ Features:
-• Maximum timeframe approach eliminates duplicate reporting
-• Automatic time categorization (0-1h, 1-4h, 4-8h, etc.)
-• Site-based grouping prevents cross-site matches
-• Enhanced analysis options for Excel exports
-• Automatic CSV repair for corrupted files
-        """
-        
-        ttk.Label(self.welcome_content, text=welcome_text.strip(),
+        # The text is laid out once the window is up; it is the first tab shown
+        self.root.after_idle(self._build_welcome_label)
+    
+    def _build_welcome_label(self):
+        """Fill the welcome tab with the quick start instructions."""
+        ttk.Label(self.welcome_content, text=self.WELCOME_TEXT,
                  style='Info.TLabel', justify='left').pack(pady=50)
     
     def create_footer(self):
@@ -377,9 +546,8 @@ class DuplicateTicketApp:
         self.footer_frame.pack(fill='x', pady=(20, 0))
     
     def repair_progress_callback(self, message: str):
-        """Handle repair progress updates."""
-        self.status_var.set(f"Repair: {message}")
-        self.root.update_idletasks()
+        """Handle repair progress updates (called from the loading thread)."""
+        self.root.after(0, self.status_var.set, f"Repair: {message}")
     
     def set_max_timeframe(self, value):
         """Set maximum timeframe from preset."""
@@ -387,20 +555,9 @@ class DuplicateTicketApp:
     
     def update_similarity_label(self, value):
         """Update similarity threshold label with guidance."""
-        threshold = int(float(value))
-        self.similarity_label_var.set(f"{threshold}%")
-        
-        # Update guidance
-        if threshold >= 95:
-            self.similarity_guide_var.set("Very Strict - Only exact matches")
-        elif threshold >= 90:
-            self.similarity_guide_var.set("Strict - High precision, fewer matches")
-        elif threshold >= 80:
-            self.similarity_guide_var.set("Balanced - Good for most cases")
-        elif threshold >= 70:
-            self.similarity_guide_var.set("Relaxed - More matches, some false positives")
-        else:
-            self.similarity_guide_var.set("Very Relaxed - Many matches, review carefully")
+        index = min(max(int(float(value)), 50), 100) - 50
+        self.similarity_label_var.set(self.SIMILARITY_LABELS[index])
+        self.similarity_guide_var.set(self.SIMILARITY_GUIDES[index])
     
     def load_file(self):
         """Load and validate CSV file with enhanced feedback."""
@@ -415,65 +572,99 @@ class DuplicateTicketApp:
         # Show loading feedback
         self.status_var.set("Loading and validating CSV file...")
         self.load_button.configure(text="Loading...", state='disabled')
-        self.root.update()
-        
-        # Load file
-        success, message = self.csv_parser.load_and_validate(
-            file_path, auto_repair=self.auto_repair_var.get()
-        )
+        self.analyze_button.configure(state='disabled')
+        self.progress_bar.configure(mode='indeterminate')
+        self.progress_bar.pack(side='right', padx=(20, 0))
+        self.progress_bar.start(50)
+        
+        # Load file on a worker thread so the window keeps repainting
+        threading.Thread(target=self._load_worker, args=(file_path, self.auto_repair_var.get()),
+                         daemon=True).start()
+    
+    def _load_worker(self, file_path, auto_repair):
+        """Load and validate the CSV file off the Tk main thread."""
+        try:
+            success, message = self.csv_parser.load_and_validate(file_path, auto_repair=auto_repair)
+        except Exception as e:
+            success, message = False, str(e)
         
-        if success:
-            self.current_file_path = file_path
-            filename = os.path.basename(file_path)
-            self.file_path_var.set(f"✓ {filename}")
-            
-            # Show file statistics
-            summary = self.csv_parser.get_data_summary()
-            stats_text = f"📊 {summary['total_tickets']} tickets from {summary['unique_sites']} sites"
-            if summary.get('was_repaired', False):
-                stats_text += " (auto-repaired)"
-            self.file_stats_var.set(stats_text)
-            self.file_stats_frame.pack(fill='x', pady=(10, 0))
-            
-            # Show data info
-            date_range = (summary['date_range']['earliest'].strftime('%Y-%m-%d') + 
-                         " to " + summary['date_range']['latest'].strftime('%Y-%m-%d'))
-            resolved_info = f", {summary['resolved_tickets']} resolved" if summary.get('resolved_tickets', 0) > 0 else ""
-            
-            self.status_var.set(f"Ready to analyze • {date_range}{resolved_info}")
-            
-            # Clear previous results
-            self.clear_results()
+        self.root.after(0, self._load_finish, file_path, success, message)
+    
+    def _load_finish(self, file_path, success, message):
+        """Show the outcome of a CSV load on the main thread."""
+        try:
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode='determinate')
+            self.progress_bar.pack_forget()
             
-        else:
-            self.current_file_path = None
-            self.file_path_var.set("❌ Failed to load file")
-            self.file_stats_frame.pack_forget()
-            self.status_var.set(f"Error: {message}")
-        
-        # Restore button
-        self.load_button.configure(text="Select CSV File", state='normal')
-        self.update_ui_state()
+            if success:
+                self.current_file_path = file_path
+                filename = os.path.basename(file_path)
+                self.file_path_var.set(f"✓ {filename}")
+                
+                # Show file statistics
+                summary = self.csv_parser.get_data_summary()
+                stats_text = f"📊 {summary['total_tickets']} tickets from {summary['unique_sites']} sites"
+                if summary.get('was_repaired', False):
+                    stats_text += " (auto-repaired)"
+                self.file_stats_var.set(stats_text)
+                self.file_stats_frame.pack(fill='x', pady=(10, 0))
+                
+                # Show data info
+                date_range = (summary['date_range']['earliest'].strftime('%Y-%m-%d') + 
+                             " to " + summary['date_range']['latest'].strftime('%Y-%m-%d'))
+                resolved_info = f", {summary['resolved_tickets']} resolved" if summary.get('resolved_tickets', 0) > 0 else ""
+                
+                self.status_var.set(f"Ready to analyze • {date_range}{resolved_info}")
+                
+                # Clear previous results
+                self.clear_results()
+                
+            else:
+                self.current_file_path = None
+                self.file_path_var.set("❌ Failed to load file")
+                self.file_stats_frame.pack_forget()
+                self.status_var.set(f"Error: {message}")
+        finally:
+            # Restore button even if the summary could not be shown
+            self.load_button.configure(text="Select CSV File", state='normal')
+            self.update_ui_state()
     
     def run_analysis_threaded(self):
         """Run analysis in a separate thread."""
-        threading.Thread(target=self.run_analysis, daemon=True).start()
+        # Snapshot the settings here: Tk variables must only be read on the main thread
+        try:
+            config = {
+                'max_timeframe': self.max_timeframe_var.get(),
+                'similarity_threshold': self.similarity_var.get(),
+                'exclude_resolved': self.exclude_resolved_var.get(),
+                'same_day': self.enable_same_day_var.get(),
+                'rapid_fire': self.enable_rapid_fire_var.get(),
+                'exact_match': self.enable_exact_match_var.get(),
+                'category_patterns': self.enable_category_patterns_var.get()
+            }
+        except (tk.TclError, ValueError) as e:
+            messagebox.showerror("Configuration Error", f"Please check your settings:\n{str(e)}")
+            return
+        
+        threading.Thread(target=self.run_analysis, args=(config,), daemon=True).start()
     
-    def run_analysis(self):
-        """Run the duplicate detection analysis."""
+    def run_analysis(self, config):
+        """Run the duplicate detection analysis with a settings snapshot from run_analysis_threaded."""
+        finished = False
         try:
             # Parse configuration
-            max_timeframe = self.max_timeframe_var.get()
-            similarity_threshold = self.similarity_var.get()
-            exclude_resolved = self.exclude_resolved_var.get()
+            max_timeframe = config['max_timeframe']
+            similarity_threshold = config['similarity_threshold']
+            exclude_resolved = config['exclude_resolved']
             
             # Update UI
-            self.root.after(0, lambda: self.set_analysis_running(True))
+            self.root.after(0, self.set_analysis_running, True)
             
             # Get data
             data = self.csv_parser.get_filtered_data(exclude_resolved)
             
-            if data.empty:
+            if data.shape[0] == 0:
                 self.root.after(0, lambda: messagebox.showwarning(
                     "No Data", "No tickets to analyze after applying filters."))
                 return
@@ -483,19 +674,19 @@ class DuplicateTicketApp:
             
             # Check if any enhanced analysis is enabled
             enable_enhanced = any([
-                self.enable_same_day_var.get(),
-                self.enable_rapid_fire_var.get(),
-                self.enable_exact_match_var.get(),
-                self.enable_category_patterns_var.get()
+                config['same_day'],
+                config['rapid_fire'],
+                config['exact_match'],
+                config['category_patterns']
             ])
             
             if enable_enhanced:
                 self.analysis_results = self.duplicate_detector.analyze_enhanced(
                     data, max_timeframe, similarity_threshold,
-                    enable_same_day=self.enable_same_day_var.get(),
-                    enable_rapid_fire=self.enable_rapid_fire_var.get(),
-                    enable_exact_match=self.enable_exact_match_var.get(),
-                    enable_category_patterns=self.enable_category_patterns_var.get()
+                    enable_same_day=config['same_day'],
+                    enable_rapid_fire=config['rapid_fire'],
+                    enable_exact_match=config['exact_match'],
+                    enable_category_patterns=config['category_patterns']
                 )
                 # Store results in new format for display
                 self.fuzzy_results = self.analysis_results['fuzzy_matching']
@@ -505,7 +696,10 @@ class DuplicateTicketApp:
                 self.analysis_results = {'fuzzy_matching': self.fuzzy_results}
             
             # Update UI with results
-            self.root.after(0, self.display_results)
+            self.export_frame = None
+            self.result_counts = self.summarize_results()
+            self.root.after(0, self._finish_analysis)
+            finished = True
             
         except ValueError as e:
             self.root.after(0, lambda: messagebox.showerror("Configuration Error", 
@@ -514,16 +708,34 @@ class DuplicateTicketApp:
             error_msg = f"Analysis failed with an unexpected error:\n{str(e)}\n\nPlease check your CSV file format and try again."
             self.root.after(0, lambda: messagebox.showerror("Analysis Error", error_msg))
         finally:
-            self.root.after(0, lambda: self.set_analysis_running(False))
+            # A completed analysis resets the controls in _finish_analysis instead
+            if not finished:
+                self.root.after(0, self.set_analysis_running, False)
+    
+    def _finish_analysis(self):
+        """Show the results and reset the analysis controls in one main-thread callback."""
+        try:
+            self.display_results()
+        finally:
+            self.set_analysis_running(False)
     
     def progress_callback(self, message: str, current: int, total: int):
-        """Handle analysis progress updates."""
-        progress_percent = (current / total) * 100 if total > 0 else 0
+        """Handle analysis progress updates, coalescing them into at most one redraw per frame."""
+        # Replace the whole slot at once so the main thread never sees a half-written update
+        self._progress_slot = (message, current * 100.0 / total if total > 0 else 0)
         
-        self.root.after(0, lambda: [
-            self.status_var.set(f"Analyzing: {message}"),
-            self.progress_var.set(progress_percent)
-        ])
+        if not self._progress_pending:
+            self._progress_pending = True
+            self._progress_after_id = self.root.after(self.PROGRESS_REDRAW_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Show the latest progress update (runs on the main thread)."""
+        # Clear the flag before reading so an update arriving meanwhile schedules another flush
+        self._progress_after_id = None
+        self._progress_pending = False
+        message, progress_percent = self._progress_slot
+        self.status_var.set(f"Analyzing: {message}")
+        self.progress_var.set(progress_percent)
     
     def set_analysis_running(self, running: bool):
         """Update UI state during analysis."""
@@ -531,6 +743,12 @@ class DuplicateTicketApp:
             self.analyze_button.configure(state='disabled', text="Analyzing...")
             self.progress_bar.pack(side='right', padx=(20, 0))
         else:
+            # A flush still pending from the last progress update would overwrite the final status
+            if self._progress_after_id is not None:
+                self.root.after_cancel(self._progress_after_id)
+                self._progress_after_id = None
+            self._progress_pending = False
+            
             self.analyze_button.configure(state='normal', text="Run Analysis")
             self.progress_bar.pack_forget()
         
@@ -539,28 +757,15 @@ class DuplicateTicketApp:
     def display_results(self):
         """Display analysis results with enhanced visualization."""
         # Clear existing result tabs (keep welcome)
-        for tab_id in self.results_notebook.tabs()[1:]:  # Skip welcome tab
-            self.results_notebook.forget(tab_id)
+        self.remove_result_tabs()
         
         if not self.analysis_results:
             self.results_summary_var.set("No results to display")
             return
         
-        # Handle both enhanced and new single timeframe formats
-        if hasattr(self, 'fuzzy_results'):
-            # New format: list of duplicate pairs
-            total_duplicates = len(self.fuzzy_results) if self.fuzzy_results else 0
-        elif 'fuzzy_matching' in self.analysis_results:
-            # Enhanced results format
-            fuzzy_results = self.analysis_results['fuzzy_matching']
-            if isinstance(fuzzy_results, list):
-                total_duplicates = len(fuzzy_results)
-            else:
-                # Legacy multi-window format
-                total_duplicates = sum(len(pairs) for pairs in fuzzy_results.values()) if fuzzy_results else 0
-        else:
-            # Legacy format (backward compatibility)
-            total_duplicates = sum(len(pairs) for pairs in self.analysis_results.values())
+        # Counts were taken once on the analysis thread
+        summary = self.result_counts
+        total_duplicates = summary.total
         
         if total_duplicates == 0:
             self.results_summary_var.set("✅ No duplicate tickets found")
@@ -576,26 +781,71 @@ class DuplicateTicketApp:
             return
         
         # Update summary
-        affected_sites = len(set(dup['site'] for pairs in self.analysis_results.values() for dup in pairs))
-        self.results_summary_var.set(f"🔍 Found {total_duplicates} potential duplicates across {affected_sites} sites")
+        self.results_summary_var.set(f"🔍 Found {total_duplicates} potential duplicates across {summary.affected_sites} sites")
         
         # Create result tabs
-        for time_window in sorted(self.analysis_results.keys()):
+        for time_window in sorted(summary.per_window):
             duplicates = self.analysis_results[time_window]
             
-            if duplicates:
+            if summary.per_window[time_window]:
                 tab_frame = ttk.Frame(self.results_notebook)
-                tab_name = f"Within {time_window}h ({len(duplicates)})"
+                tab_name = f"Within {time_window}h ({summary.per_window[time_window]})"
                 self.results_notebook.add(tab_frame, text=tab_name)
                 
-                self.create_enhanced_results_table(tab_frame, duplicates, time_window)
+                # The table is built the first time its tab is selected
+                self.pending_tabs[str(tab_frame)] = (tab_frame, duplicates, time_window)
         
         # Switch to first results tab
         if len(self.results_notebook.tabs()) > 1:
             self.results_notebook.select(1)
         
         self.status_var.set(f"Analysis complete - {total_duplicates} potential duplicates found")
-        self.update_ui_state()
+    
+    def remove_result_tabs(self):
+        """Destroy every results tab after the welcome tab, together with its table."""
+        self.pending_tabs.clear()
+        
+        # Forgetting a tab would keep its frame and Treeview alive; destroying removes both
+        for tab_id in self.results_notebook.tabs()[1:]:
+            self.results_notebook.nametowidget(tab_id).destroy()
+    
+    def build_selected_tab(self, event=None):
+        """Build the results table of the selected tab if it has not been built yet."""
+        pending = self.pending_tabs.pop(self.results_notebook.select(), None)
+        if pending:
+            self.create_enhanced_results_table(*pending)
+    
+    def summarize_results(self):
+        """
+        Count the analysis results in a single pass over them.
+        
+        Returns:
+            Namespace with total (duplicate pairs), affected_sites and per_window
+            (pair count for each results key)
+        """
+        per_window = {}
+        sites = set()
+        for time_window, duplicates in self.analysis_results.items():
+            per_window[time_window] = len(duplicates)
+            sites.update(map(itemgetter('site'), duplicates))
+        
+        # Handle both enhanced and new single timeframe formats
+        if hasattr(self, 'fuzzy_results'):
+            # New format: list of duplicate pairs
+            total = len(self.fuzzy_results) if self.fuzzy_results else 0
+        elif 'fuzzy_matching' in self.analysis_results:
+            # Enhanced results format
+            fuzzy_results = self.analysis_results['fuzzy_matching']
+            if isinstance(fuzzy_results, list):
+                total = len(fuzzy_results)
+            else:
+                # Legacy multi-window format
+                total = sum(len(pairs) for pairs in fuzzy_results.values()) if fuzzy_results else 0
+        else:
+            # Legacy format (backward compatibility)
+            total = sum(per_window.values())
+        
+        return SimpleNamespace(total=total, affected_sites=len(sites), per_window=per_window)
     
     def create_enhanced_results_table(self, parent, duplicates, time_window):
         """Create an enhanced results table with better formatting."""
@@ -633,14 +883,10 @@ class DuplicateTicketApp:
             'Similarity': 80
         }
         
-        for col in columns:
-            tree.heading(col, text=col, command=lambda c=col: self.sort_treeview(tree, c, False))
-            tree.column(col, width=column_configs[col], minwidth=60)
-        
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=tree.yview)
+        # Add scrollbars; the vertical one pages through the rows held by the view below
+        v_scrollbar = ttk.Scrollbar(table_frame, orient='vertical')
         h_scrollbar = ttk.Scrollbar(table_frame, orient='horizontal', command=tree.xview)
-        tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        tree.configure(xscrollcommand=h_scrollbar.set)
         
         # Pack components
         tree.grid(row=0, column=0, sticky='nsew')
@@ -650,52 +896,49 @@ class DuplicateTicketApp:
         table_frame.grid_rowconfigure(0, weight=1)
         table_frame.grid_columnconfigure(0, weight=1)
         
-        # Populate with data
-        for duplicate in duplicates:
-            # Format descriptions with truncation
-            desc1 = self.truncate_text(duplicate['ticket1_description'], 40)
-            desc2 = self.truncate_text(duplicate['ticket2_description'], 40)
-            
-            values = (
-                self.truncate_text(duplicate['site'], 25),
-                duplicate['ticket1_number'],
-                desc1,
-                duplicate['ticket2_number'],
-                desc2,
-                duplicate['time_difference_formatted'],
-                f"{duplicate['similarity_score']}%"
-            )
-            
-            # Add color coding based on similarity
-            item = tree.insert('', 'end', values=values)
-            if duplicate['similarity_score'] >= 95:
-                tree.set(item, 'Similarity', f"🔴 {duplicate['similarity_score']}%")
-            elif duplicate['similarity_score'] >= 90:
-                tree.set(item, 'Similarity', f"🟡 {duplicate['similarity_score']}%")
-            else:
-                tree.set(item, 'Similarity', f"🟢 {duplicate['similarity_score']}%")
-    
-    def truncate_text(self, text, max_length):
-        """Truncate text with ellipsis if too long."""
-        if len(text) <= max_length:
-            return text
-        return text[:max_length-3] + "..."
-    
-    def sort_treeview(self, tree, col, reverse):
-        """Sort treeview by column."""
-        data = [(tree.set(child, col), child) for child in tree.get_children('')]
-        
-        # Clean similarity column for sorting
-        if col == 'Similarity':
-            data = [(item[0].split()[-1].replace('%', ''), item[1]) for item in data]
-            data.sort(key=lambda x: int(x[0]), reverse=reverse)
-        else:
-            data.sort(key=lambda x: x[0], reverse=reverse)
+        # Populate with data: format every row once, but only the visible page becomes Tk items
+        rows = list(map(self.format_duplicate_row, duplicates))
         
-        for index, (val, child) in enumerate(data):
-            tree.move(child, '', index)
+        # Similarity sorts by the raw score rather than its "🟢 85%" display text
+        scores = np.fromiter((duplicate['similarity_score'] for duplicate in duplicates),
+                             dtype=np.int64, count=len(duplicates))
+        view = VirtualTreeview(tree, v_scrollbar, rows, {columns.index('Similarity'): scores})
         
-        tree.heading(col, command=lambda: self.sort_treeview(tree, col, not reverse))
+        for col in columns:
+            tree.heading(col, text=col, command=partial(self.sort_treeview, view, col, False))
+            tree.column(col, width=column_configs[col], minwidth=60)
+    
+    def format_duplicate_row(self, duplicate):
+        """Format a duplicate pair as Treeview values, with the similarity color-coded."""
+        # Truncate long text to the column width, leaving room for an ellipsis
+        site = duplicate['site']
+        if len(site) > self.SITE_TEXT_LENGTH:
+            site = site[:self.SITE_TEXT_LENGTH - 3] + "..."
+        description1 = duplicate['ticket1_description']
+        if len(description1) > self.DESCRIPTION_TEXT_LENGTH:
+            description1 = description1[:self.DESCRIPTION_TEXT_LENGTH - 3] + "..."
+        description2 = duplicate['ticket2_description']
+        if len(description2) > self.DESCRIPTION_TEXT_LENGTH:
+            description2 = description2[:self.DESCRIPTION_TEXT_LENGTH - 3] + "..."
+        
+        return (
+            site,
+            duplicate['ticket1_number'],
+            description1,
+            duplicate['ticket2_number'],
+            description2,
+            duplicate['time_difference_formatted'],
+            similarity_label(duplicate['similarity_score'])
+        )
+    
+    def sort_treeview(self, view, col, reverse):
+        """Sort a results table by column."""
+        columns = view.tree['columns']
+        
+        # Similarity already has numeric keys; the other columns sort as text
+        view.sort(columns.index(col), str, reverse)
+        
+        view.tree.heading(col, command=partial(self.sort_treeview, view, col, not reverse))
     
     def export_results(self):
         """Export results with user feedback."""
@@ -706,7 +949,8 @@ class DuplicateTicketApp:
         file_path = filedialog.asksaveasfilename(
             title="Export Analysis Results",
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx")]
+            filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx"), ("Parquet files", "*.parquet"),
+                       ("Feather files", "*.feather")]
         )
         
         if not file_path:
@@ -735,20 +979,11 @@ class DuplicateTicketApp:
                     enable_category_patterns=self.enable_category_patterns_var.get()
                 )
             else:
-                # Use standard export (CSV or single-sheet Excel)
-                if hasattr(self, 'fuzzy_results') and self.fuzzy_results:
-                    # New format: use the dedicated export method
-                    df = self.duplicate_detector.export_results_new(self.fuzzy_results)
-                elif 'fuzzy_matching' in self.analysis_results:
-                    # Enhanced format: convert back to standard DataFrame
-                    df = self.export_manager._convert_fuzzy_results_to_dataframe(
-                        self.analysis_results['fuzzy_matching']
-                    )
-                else:
-                    # Legacy format
-                    df = self.duplicate_detector.export_results()
+                # Use standard export (CSV or single-sheet Excel); the table is kept for re-exports
+                if self.export_frame is None:
+                    self.export_frame = self.build_export_frame()
                 
-                success, message = self.export_manager.export_data(df, file_path)
+                success, message = self.export_manager.export_data(self.export_frame, file_path)
             
             if success:
                 self.status_var.set(f"✅ Results exported to {os.path.basename(file_path)}")
@@ -760,16 +995,30 @@ class DuplicateTicketApp:
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
     
+    def build_export_frame(self):
+        """Build the standard export DataFrame from the current analysis results."""
+        if hasattr(self, 'fuzzy_results') and self.fuzzy_results:
+            # New format: use the dedicated export method
+            return self.duplicate_detector.export_results_new(self.fuzzy_results)
+        elif 'fuzzy_matching' in self.analysis_results:
+            # Enhanced format: convert back to standard DataFrame
+            return self.export_manager._convert_fuzzy_results_to_dataframe(
+                self.analysis_results['fuzzy_matching']
+            )
+        else:
+            # Legacy format
+            return self.duplicate_detector.export_results()
+    
     def clear_results(self):
         """Clear all results."""
         # Clear result tabs (keep welcome)
-        for tab_id in self.results_notebook.tabs()[1:]:
-            self.results_notebook.forget(tab_id)
+        self.remove_result_tabs()
         
         # Switch back to welcome
         self.results_notebook.select(0)
         
         self.analysis_results = {}
+        self.export_frame = None
         self.results_summary_var.set("Run analysis to see results")
         self.status_var.set("Results cleared")
         self.update_ui_state()
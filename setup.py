@@ -49,9 +49,9 @@ def check_optional_dependencies():
     """Check for optional dependencies and suggest installation."""
     optional_deps = [
         ("chardet", "Better encoding detection for CSV repair"),
-        ("fuzzywuzzy", "Enhanced string similarity matching"),
-        ("python-Levenshtein", "Faster fuzzy string operations"),
-        ("openpyxl", "Excel export functionality"),
+        ("cchardet", "Faster encoding detection (pip install faust-cchardet)"),
+        ("xlsxwriter", "Excel export functionality"),
+        ("pyarrow", "Faster CSV loading"),
     ]
     
     print("\n📋 Checking optional dependencies:")